@@ -6,19 +6,54 @@ from constants import CONFIG_FILE
 
 logger = logging.getLogger("GPIO_Control")
 
+# Faster JSON library if installed (optional); the stdlib json module otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Pin keys are ints in memory (e.g. 13); non-numeric identifiers such as the
+# analog module's "2,3" stay strings. The JSON file always uses string keys.
+# Other modules import this dict directly, so it is updated in place, never rebound.
 config_data = {}
 
+def _replace_config(new_config):
+    """Replace the shared config dict's contents in place"""
+    config_data.clear()
+    config_data.update(new_config)
+
+def _read_config_file():
+    """Return the raw (string-keyed) config stored in CONFIG_FILE"""
+    with open(CONFIG_FILE, "rb") as f:
+        data = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _write_config_file(raw):
+    """Atomically replace CONFIG_FILE with raw (string-keyed) config"""
+    if orjson is not None:
+        data = orjson.dumps(raw, option=orjson.OPT_INDENT_2)
+    else:
+        # indent=2 matches OPT_INDENT_2, so the file looks the same either way
+        data = json.dumps(raw, indent=2, ensure_ascii=False).encode()
+    # Write a temp file and swap it in, so a crash or power loss mid-write
+    # leaves the previous config intact instead of a truncated file
+    tmp_file = CONFIG_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, CONFIG_FILE)
+
 def clear_config_on_startup():
     """Clear all configurations on program startup for classroom use"""
-    global config_data
     logger.info("🎓 CLASSROOM MODE: Clearing all configurations for new class session")
     try:
         # Clear the in-memory config
-        config_data = {}
+        config_data.clear()
         
         # Clear the config file by writing empty dict
-        with open(CONFIG_FILE, "w") as f:
-            json.dump({}, f, indent=4)
+        _write_config_file({})
             
         logger.info("✅ All configurations cleared successfully - ready for new class")
         return True
@@ -26,41 +61,39 @@ def clear_config_on_startup():
     except Exception as e:
         logger.error(f"❌ Error clearing configuration on startup: {e}")
         # Even if file operation fails, ensure in-memory config is clear
-        config_data = {}
+        config_data.clear()
         return False
 
 def load_config():
     """Load GPIO configuration from file"""
-    global config_data
     logger.info(f"Loading configuration from {CONFIG_FILE}")
     try:
-        with open(CONFIG_FILE, "r") as f:
-            config_data = json.load(f)
-            logger.info(f"Configuration loaded: {config_data}")
-            return config_data
+        raw = _read_config_file()
+        _replace_config({int(k) if k.isdigit() else k: v for k, v in raw.items()})
+        logger.info(f"Configuration loaded: {config_data}")
+        return config_data
     except FileNotFoundError:
         logger.info(f"Config file not found, creating empty config")
-        config_data = {}
+        config_data.clear()
         return config_data
     except json.JSONDecodeError as e:
         logger.error(f"Error parsing config file: {e}")
         logger.info("Using empty configuration")
-        config_data = {}
+        config_data.clear()
         return config_data
     except Exception as e:
         logger.error(f"Unexpected error loading config: {e}")
-        config_data = {}
+        config_data.clear()
         return config_data
 
 def save_config(config):
     """Save GPIO configuration to file"""
-    global config_data
     logger.info(f"Saving configuration: {config}")
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=4)
-            logger.info("Configuration saved successfully")
-            config_data = config
+        _write_config_file({str(k): v for k, v in config.items()})
+        logger.info("Configuration saved successfully")
+        if config is not config_data:
+            _replace_config(config)
     except Exception as e:
         logger.error(f"Error saving configuration: {e}")
         # Note: Can't use parent=self.root here as this is a module function, not a class method
@@ -2,13 +2,53 @@ import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
 import logging
+import platform
 import traceback
 from config_manager import save_config, config_data
-from constants import NOSE_GEAR_PIN, LEFT_GEAR_PIN, RIGHT_GEAR_PIN, LEFT_NAV_PIN, RIGHT_NAV_PIN, TAIL_NAV_PIN, MIC_CONTROL_PIN, ANALOG_INPUT_MODULE_ID
+from constants import NOSE_GEAR_PIN, LEFT_GEAR_PIN, RIGHT_GEAR_PIN, LEFT_NAV_PIN, RIGHT_NAV_PIN, TAIL_NAV_PIN, ANALOG_INPUT_MODULE_ID
+from constants import ALL_GPIO_PINS, PREDEFINED_FUNCTIONS, PREDEFINED_FUNCTION_PINS
 from gpio_handler import SIMULATED_MODE
 
 logger = logging.getLogger("GPIO_Control")
 
+# Resolved once at import; the platform cannot change while the app is running
+_IS_LINUX = platform.system() == "Linux"
+
+# Functions that configure a fixed set of pins. Each pin in "pins" is saved as
+# the function name plus the matching suffix from "labels"; "info" is appended
+# to the predefined-pin popup.
+_SPECIAL_FUNCTIONS = {
+    "Landing Gear Control": {
+        "pins": (NOSE_GEAR_PIN, LEFT_GEAR_PIN, RIGHT_GEAR_PIN),
+        "labels": ("", " (Left)", " (Right)"),
+        "info": f"\n\nThis will also configure pins:\n- Left Gear: GPIO {LEFT_GEAR_PIN}\n- Right Gear: GPIO {RIGHT_GEAR_PIN}"
+    },
+    "Nav Light Toggle": {
+        "pins": (LEFT_NAV_PIN, RIGHT_NAV_PIN, TAIL_NAV_PIN),
+        "labels": ("", " (Right)", " (Tail)"),
+        "info": f"\n\nThis will also configure pins:\n- Right Nav: GPIO {RIGHT_NAV_PIN}\n- Tail Nav: GPIO {TAIL_NAV_PIN}"
+    },
+    "Analog Input Module": {
+        # Uses a single identifier for both I2C pins
+        "pins": (ANALOG_INPUT_MODULE_ID,),
+        "labels": ("",),
+        "info": "\n\nThis will configure I2C communication for:\n- Gauges (POT, TEMP, AUX)\n- Coax signal monitoring\n- Mic audio level monitoring"
+    }
+}
+
+# Full predefined-pin popup text per function, built once at import
+_PREDEFINED_INFO = {
+    function: (f"The function '{function}' is internally assigned to GPIO pins {pins}."
+               + _SPECIAL_FUNCTIONS.get(function, {}).get("info", ""))
+    for function, pins in PREDEFINED_FUNCTION_PINS.items()
+}
+
+def _available_pins():
+    """Return the assignable GPIO pins that are not already configured"""
+    available_pins = [pin for pin in ALL_GPIO_PINS if pin not in config_data]
+    logger.debug(f"Available pins: {available_pins}")
+    return available_pins
+
 def simple_teacher_test(app_instance):
     """Simple test function to verify button works"""
     try:
@@ -35,8 +75,9 @@ def show_teacher_password_dialog(app_instance):
         
         # Enhanced window management for proper layering
         password_dialog.transient(app_instance.config_window)  # Make it a child of config window
-        password_dialog.grab_set()  # Make it modal
-        password_dialog.attributes("-topmost", True)  # Keep on top
+        # Match the config window's -topmost, or X11 can stack the dialog behind it
+        password_dialog.attributes("-topmost", app_instance.config_window.attributes("-topmost"))
+        password_dialog.grab_set()  # Make it modal (routes all input here)
         password_dialog.lift()  # Bring to front
         password_dialog.focus_force()  # Force focus
         
@@ -151,74 +192,285 @@ def show_teacher_password_dialog(app_instance):
         except:
             logger.error("Could not even show error message box")
 
+def _build_config_window(self):
+    """Construct the configuration window once; later opens reuse it"""
+    logger.info("Building configuration window")
+
+    self.config_window = tk.Toplevel(self.root)
+    self.config_window.title("Configure GPIO - GPIO Control Panel")
+    self._config_geometry_cached = None
+
+    # Set window to exact size of main application
+    self.config_window.geometry("800x480")
+    self.config_window.resizable(False, False)
+
+    # Remove header bar for consistency with main window
+    self.config_window.overrideredirect(True)
+
+    # Use same background as main application
+    self.config_window.configure(bg="#1e1e2e")
+    self.config_window.transient(self.root)
+
+    # Platform-specific window management (Pi-optimized)
+    if _IS_LINUX:
+        # On Linux/Pi, use simpler window management to avoid conflicts
+        self.config_window.overrideredirect(False)
+        self.config_window.wm_attributes("-type", "dialog")
+
+    # Closing only hides the window so the next open can reuse it
+    def on_config_close():
+        self.config_window.grab_release()
+        self.config_window.withdraw()
+
+        # No need to restore since we never changed the mode
+        logger.info("Config window closed - main window mode unchanged")
+
+    self.config_window.protocol("WM_DELETE_WINDOW", on_config_close)
+
+    # Raise and grab only once the window is actually mapped; grab_set fails
+    # on a window the window manager has not shown yet. Child widgets share
+    # the toplevel's bindtag, so their <Map> events are filtered out.
+    self._config_raise_pending = False
+
+    def on_config_mapped(event):
+        if event.widget is self.config_window and self._config_raise_pending:
+            self._config_raise_pending = False
+            _raise_config_window(self)
+
+    self.config_window.bind("<Map>", on_config_mapped)
+
+    # Create a main frame with padding
+    # Use tk.Frame when we need background color, as TTK frames don't support bg option
+    main_frame = tk.Frame(self.config_window, bg="#1e1e2e", padx=20, pady=20)
+    main_frame.pack(fill=tk.BOTH, expand=True)
+
+    # Add a close button in the top-right corner since we removed the header bar
+    close_frame = tk.Frame(main_frame, bg="#1e1e2e")
+    close_frame.pack(fill=tk.X, pady=(0, 10))
+
+    config_title = tk.Label(close_frame,
+                           text="GPIO Configuration",
+                           font=("Arial", 16, "bold"),
+                           fg="white",
+                           bg="#1e1e2e")
+    config_title.pack(side=tk.LEFT)
+
+    close_button = tk.Button(close_frame,
+                            text="✕",
+                            command=on_config_close,
+                            bg="#f44336",
+                            fg="white",
+                            font=("Arial", 12, "bold"),
+                            width=3,
+                            relief=tk.FLAT)
+    close_button.pack(side=tk.RIGHT)
+
+    # Pin selection label and dropdown (values are filled in when the list is opened)
+    pin_label = self.tkLabel(main_frame, text="Select GPIO Pin:", font=("Arial", 16), fg="white", bg="#1e1e2e")
+    pin_label.pack(pady=(0, 10))
+
+    pin_var = tk.StringVar()
+    pin_dropdown = self.Combobox(main_frame, textvariable=pin_var,
+                                 state="readonly",
+                                 font=("Arial", 14),
+                                 width=30)
+    pin_dropdown.configure(postcommand=lambda: pin_dropdown.configure(values=_available_pins()))
+    pin_dropdown.pack(pady=(0, 20))
+
+    # Function selection label and dropdown
+    function_label = self.tkLabel(main_frame, text="Assign Function:", font=("Arial", 16), fg="white", bg="#1e1e2e")
+    function_label.pack(pady=(0, 10))
+
+    function_var = tk.StringVar()
+    function_dropdown = self.Combobox(main_frame, textvariable=function_var,
+                                      values=PREDEFINED_FUNCTIONS,
+                                      state="readonly",
+                                      font=("Arial", 14),
+                                      width=30)
+    function_dropdown.pack(pady=(0, 20))
+
+    # Keep references so open_config_window can refresh them in place
+    self.pin_var = pin_var
+    self.function_var = function_var
+    self.pin_dropdown = pin_dropdown
+    self.function_dropdown = function_dropdown
+
+    # Predefined pin info popup, built on first use and then hidden/re-shown
+    self._pred_info_popup = None
+
+    def hide_predefined_info():
+        self._pred_info_popup.grab_release()
+        self._pred_info_popup.withdraw()
+        # Hand the modal grab back to the config window
+        self.config_window.grab_set()
+
+    def show_predefined_info(text):
+        if self._pred_info_popup is None:
+            popup = tk.Toplevel(self.config_window)
+            popup.title("Predefined Pin Info")
+            popup.geometry("350x200")
+            popup.configure(bg="#1e1e2e")
+
+            # Make popup appear on top of the config window
+            popup.transient(self.config_window)
+            popup.protocol("WM_DELETE_WINDOW", hide_predefined_info)
+
+            self._pred_info_var = tk.StringVar()
+            info_label = self.tkLabel(popup,
+                                      textvariable=self._pred_info_var,
+                                      wraplength=330,
+                                      justify="center",
+                                      font=("Arial", 12),
+                                      fg="white",
+                                      bg="#1e1e2e")
+            info_label.pack(expand=True, pady=10)
+
+            ok_button = self.Button(popup, text="OK", command=hide_predefined_info, style="success.TButton")
+            ok_button.pack(pady=10)
+
+            self._pred_info_popup = popup
+
+        self._pred_info_var.set(text)
+        # Match the config window's -topmost, or X11 can stack the popup behind it
+        self._pred_info_popup.attributes("-topmost", self.config_window.attributes("-topmost"))
+        self._pred_info_popup.deiconify()
+        self._pred_info_popup.lift()
+        self._pred_info_popup.grab_set()
+
+    # Function selection handler
+    def on_function_selected(event):
+        selected_function = function_var.get()
+        logger.debug(f"Function selected: {selected_function}")
+
+        if selected_function in PREDEFINED_FUNCTION_PINS:
+            pin_var.set(PREDEFINED_FUNCTION_PINS[selected_function])
+            pin_dropdown.configure(state="disabled")
+
+            info_text = _PREDEFINED_INFO[selected_function]
+            self.root.after(100, lambda: show_predefined_info(info_text))
+        else:
+            pin_dropdown.configure(state="readonly")
+
+    function_dropdown.bind("<<ComboboxSelected>>", on_function_selected)
+
+    # Save function
+    def save_assignment():
+        function = function_var.get()
+        pin = pin_var.get()
+
+        if not pin or not function:
+            # Show the inline status banner instead of a new messagebox window
+            self._cfg_status.config(text="Please select both a pin and a function.")
+            self._cfg_status.pack(before=button_frame, pady=(10, 0))
+            return
+
+        self._cfg_status.pack_forget()
+
+        # Dropdown values are strings; numeric pins are stored as int keys
+        if pin.isdigit():
+            pin = int(pin)
+
+        logger.info(f"Saving assignment: {function} -> pin {pin}")
+
+        # Special handling for functions that control a fixed set of pins
+        special = _SPECIAL_FUNCTIONS.get(function)
+        if special:
+            for special_pin, suffix in zip(special["pins"], special["labels"]):
+                config_data[special_pin] = f"{function}{suffix}"
+            logger.info(f"Configured {function} pins: {', '.join(str(p) for p in special['pins'])}")
+        else:
+            # Standard single pin configuration
+            config_data[pin] = function
+            logger.info(f"Configured pin {pin} as {function}")
+
+        self.config_window.grab_release()
+        self.config_window.withdraw()
+
+        # Hide the dialog first so it closes immediately; the file write and
+        # control rebuild run once Tk has finished processing the close
+        def apply_saved_config():
+            save_config(config_data)
+            self.load_gpio_controls()
+            self.update_overlay_status()
+            # Checked after the reload so start_mic_check sees the new function set
+            if function == "Mic Control" and not SIMULATED_MODE:
+                logger.info("Starting mic check for newly configured mic control")
+                self.start_mic_check()
+
+        self.root.after_idle(apply_saved_config)
+
+    # Inline validation banner, packed above the buttons only while it has a message
+    self._cfg_status = tk.Label(main_frame, fg="#ff6b6b", bg="#1e1e2e", font=("Arial", 12))
+
+    # Buttons with larger, more touch-friendly size
+    # Use tk.Frame when we need background color, as TTK frames don't support bg option
+    button_frame = tk.Frame(main_frame, bg="#1e1e2e")
+    button_frame.pack(fill=tk.X, pady=(20, 0))
+
+    save_button = self.Button(
+        button_frame,
+        text="Save",
+        command=save_assignment,
+        style="success.TButton",
+        width=15
+    )
+    save_button.pack(side=tk.LEFT, padx=5, expand=True)
+
+    clear_button = self.Button(
+        button_frame,
+        text="Clear All Configs",
+        command=self.clear_all_configs,
+        style="danger.TButton",
+        width=15
+    )
+    clear_button.pack(side=tk.LEFT, padx=5, expand=True)
+    
+    # Teacher Mode button
+    teacher_button = self.Button(
+        button_frame,
+        text="Teacher Mode",
+        command=lambda: show_teacher_password_dialog(self),
+        style="warning.TButton",
+        width=15
+    )
+    teacher_button.pack(side=tk.RIGHT, padx=5, expand=True)
+
+    # Start hidden; open_config_window shows it
+    self.config_window.withdraw()
+
+
+def _raise_config_window(self):
+    """Make the mapped config window topmost, then grab and focus it"""
+    try:
+        self.config_window.attributes("-topmost", True)
+        self.config_window.lift()
+        self.config_window.grab_set()
+        self.config_window.focus_force()
+        logger.info("Config window visibility set successfully")
+    except Exception as e:
+        logger.warning(f"Window visibility setting failed: {e}, continuing anyway")
+
+
 def open_config_window(self):
     """Open the configuration window with enhanced Pi-compatible visibility"""
     try:
         logger.info("Opening configuration window")
-        
-        # Check if a config window is already open and close it first
-        if hasattr(self, 'config_window'):
-            try:
-                if self.config_window.winfo_exists():
-                    logger.info("Closing existing config window")
-                    self.config_window.destroy()
-            except (AttributeError, tk.TclError):
-                # Window doesn't exist or was already destroyed
-                pass
-            # Clean up the reference
-            self.config_window = None
-        
-        # Store fullscreen state but DON'T auto-switch anymore
-        was_fullscreen = getattr(self, 'fullscreen', False)
-        # Let user stay in their preferred mode - config will appear on top
-            
-        self.config_window = tk.Toplevel(self.root)
-        self.config_window.title("Configure GPIO - GPIO Control Panel")
-
-        # Set window to exact size of main application
-        self.config_window.geometry("800x480")
-        self.config_window.resizable(False, False)
-        
-        # Remove header bar for consistency with main window
-        self.config_window.overrideredirect(True)
 
-        # Use same background as main application
-        self.config_window.configure(bg="#1e1e2e")
-        
-        # Enhanced visibility settings for all platforms
-        self.config_window.attributes("-topmost", True)
-        self.config_window.transient(self.root)
-        self.config_window.grab_set()
-        
-        # Extra visibility boost for fullscreen mode
-        if was_fullscreen:
-            self.config_window.lift()
-            self.config_window.focus_force()
-            logger.info("Config dialog opened over fullscreen window")
-        
-        # Platform-specific window management (Pi-optimized)
-        import platform
-        import time
-        system = platform.system()
-        
-        if system == "Linux":
-            # On Linux/Pi, use simpler window management to avoid conflicts
-            self.config_window.overrideredirect(False)
-            self.config_window.wm_attributes("-type", "dialog")
-            # Give Pi time to process window creation
-            time.sleep(0.1)
-            self.config_window.update()
-        
-        # Pi-optimized visibility approach with error handling
-        try:
-            # Single attempt with better error handling
-            self.config_window.lift()
-            self.config_window.focus_force()
-            self.config_window.attributes("-topmost", True)
-            self.config_window.update_idletasks()
-            logger.info("Config window visibility set successfully")
-        except Exception as e:
-            logger.warning(f"Window visibility setting failed: {e}, continuing anyway")
+        # Build the window on first use (or if it was destroyed), then reuse it
+        window = getattr(self, 'config_window', None)
+        if window is None or not window.winfo_exists():
+            _build_config_window(self)
+
+        # Reset the previous selection; the free pins are listed when the dropdown opens
+        self.pin_var.set("")
+        self.function_var.set("")
+        self.pin_dropdown.configure(state="readonly")
+        self._cfg_status.pack_forget()
+
+        # The dialog is transient and topmost, so it opens over a fullscreen root
+        # without leaving fullscreen
+        already_mapped = self.config_window.winfo_ismapped()
+        self.config_window.deiconify()
 
         # Enhanced centering function
         def center_window(window):
@@ -229,246 +481,34 @@ def open_config_window(self):
             screen_height = window.winfo_screenheight()
             x = (screen_width // 2) - (width // 2)
             y = (screen_height // 2) - (height // 2)
-            
+
             # Ensure window is fully on screen
             x = max(0, min(x, screen_width - width))
             y = max(0, min(y, screen_height - height))
-            
-            window.geometry(f'{width}x{height}+{x}+{y}')
-            logger.info(f"Config window positioned at {x},{y} ({width}x{height})")
 
-        # Center the window after forcing visibility
-        center_window(self.config_window)
-        
-        # Final visibility enforcement
-        self.config_window.lift()
-        self.config_window.attributes("-topmost", True)
-        self.config_window.focus_set()
-        
-        # Store fullscreen state to restore later
-        self.config_window._was_fullscreen = was_fullscreen
-        
-        # Add close handler (no auto-restore needed since we didn't switch)
-        def on_config_close():
-            was_fullscreen = getattr(self.config_window, '_was_fullscreen', False)
-            self.config_window.destroy()
-            
-            # No need to restore since we never changed the mode
-            logger.info("Config window closed - main window mode unchanged")
-                
-        self.config_window.protocol("WM_DELETE_WINDOW", on_config_close)
-
-        # Create a main frame with padding
-        # Use tk.Frame when we need background color, as TTK frames don't support bg option
-        main_frame = tk.Frame(self.config_window, bg="#1e1e2e", padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Add a close button in the top-right corner since we removed the header bar
-        close_frame = tk.Frame(main_frame, bg="#1e1e2e")
-        close_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        config_title = tk.Label(close_frame, 
-                               text="GPIO Configuration", 
-                               font=("Arial", 16, "bold"),
-                               fg="white", 
-                               bg="#1e1e2e")
-        config_title.pack(side=tk.LEFT)
-        
-        close_button = tk.Button(close_frame,
-                                text="✕",
-                                command=on_config_close,
-                                bg="#f44336",
-                                fg="white",
-                                font=("Arial", 12, "bold"),
-                                width=3,
-                                relief=tk.FLAT)
-        close_button.pack(side=tk.RIGHT)
-
-        # Define available pins (excluding the monitoring pins)
-        all_gpio_pins = [5, 6, 12, 16, 20, 21, 25]
-        used_pins = [int(p) for p in config_data.keys() if p.isdigit()]
-        available_pins = [pin for pin in all_gpio_pins if pin not in used_pins]
-
-        logger.debug(f"Available pins: {available_pins}")
-
-        # Predefined functions with fixed pins
-        predefined_function_pins = {
-            "Landing Gear Control": str(NOSE_GEAR_PIN),
-            "Nav Light Toggle": str(LEFT_NAV_PIN),
-            "Mic Control": str(MIC_CONTROL_PIN),
-            "Analog Input Module": ANALOG_INPUT_MODULE_ID
-        }
-
-        # List of available functions
-        predefined_functions = [
-            "Analog Input Module",
-            "Mic Control",
-            "Nav Light Toggle",
-            "Landing Gear Control",
-            "Rotary Switch",
-            "Relay Control",
-            "Lighting Control",
-            "Speed Sensor",
-            "Light Sensor",
-            "Strobe Light"
-        ]
-
-        # Pin selection label and dropdown
-        pin_label = self.tkLabel(main_frame, text="Select GPIO Pin:", font=("Arial", 16), fg="white", bg="#1e1e2e")
-        pin_label.pack(pady=(0, 10))
-
-        pin_var = tk.StringVar()
-        pin_dropdown = self.Combobox(main_frame, textvariable=pin_var,
-                                     values=available_pins,
-                                     state="readonly",
-                                     font=("Arial", 14),
-                                     width=30)
-        pin_dropdown.pack(pady=(0, 20))
-
-        # Function selection label and dropdown
-        function_label = self.tkLabel(main_frame, text="Assign Function:", font=("Arial", 16), fg="white", bg="#1e1e2e")
-        function_label.pack(pady=(0, 10))
-
-        function_var = tk.StringVar()
-        function_dropdown = self.Combobox(main_frame, textvariable=function_var,
-                                          values=predefined_functions,
-                                          state="readonly",
-                                          font=("Arial", 14),
-                                          width=30)
-        function_dropdown.pack(pady=(0, 20))
-
-        # Function selection handler
-        def on_function_selected(event):
-            selected_function = function_var.get()
-            logger.debug(f"Function selected: {selected_function}")
-
-            if selected_function in predefined_function_pins:
-                pin_var.set(predefined_function_pins[selected_function])
-                pin_dropdown.configure(state="disabled")
-
-                # Determine additional info for special functions
-                additional_info = ""
-                if selected_function == "Landing Gear Control":
-                    additional_info = f"\n\nThis will also configure pins:\n- Left Gear: GPIO {LEFT_GEAR_PIN}\n- Right Gear: GPIO {RIGHT_GEAR_PIN}"
-                elif selected_function == "Nav Light Toggle":
-                    additional_info = f"\n\nThis will also configure pins:\n- Right Nav: GPIO {RIGHT_NAV_PIN}\n- Tail Nav: GPIO {TAIL_NAV_PIN}"
-                elif selected_function == "Analog Input Module":
-                    additional_info = f"\n\nThis will configure I2C communication for:\n- Gauges (POT, TEMP, AUX)\n- Coax signal monitoring\n- Mic audio level monitoring"
-
-                def auto_close_info():
-                    popup = tk.Toplevel(self.root)
-                    popup.title("Predefined Pin Info")
-                    popup.geometry("350x200")
-                    popup.configure(bg="#1e1e2e")
-                    
-                    # Make popup appear on top
-                    popup.attributes("-topmost", True)
-                    popup.transient(self.config_window)
-                    popup.grab_set()
-
-                    info_label = self.tkLabel(popup,
-                                              text=f"The function '{selected_function}' is internally assigned to GPIO pins {predefined_function_pins[selected_function]}.{additional_info}",
-                                              wraplength=330,
-                                              justify="center",
-                                              font=("Arial", 12),
-                                              fg="white",
-                                              bg="#1e1e2e")
-                    info_label.pack(expand=True, pady=10)
-
-                    ok_button = self.Button(popup, text="OK", command=popup.destroy, style="success.TButton")
-                    ok_button.pack(pady=10)
-
-                self.root.after(100, auto_close_info)
-            else:
-                pin_dropdown.configure(state="readonly")
-
-        function_dropdown.bind("<<ComboboxSelected>>", on_function_selected)
-
-        # Save function
-        def save_assignment():
-            function = function_var.get()
-            pin = pin_var.get()
-
-            if not pin or not function:
-                # Set parent window for proper topmost behavior
-                messagebox.showwarning("Warning", "Please select both a pin and a function.",
-                                       parent=self.config_window, icon=messagebox.WARNING)
-                return
-
-            logger.info(f"Saving assignment: {function} -> pin {pin}")
-
-            # Special handling for functions that control multiple pins
-            if function == "Landing Gear Control":
-                # Configure all three landing gear pins
-                config_data[str(NOSE_GEAR_PIN)] = function
-                config_data[str(LEFT_GEAR_PIN)] = f"{function} (Left)"
-                config_data[str(RIGHT_GEAR_PIN)] = f"{function} (Right)"
-                logger.info(f"Configured landing gear pins: {NOSE_GEAR_PIN}, {LEFT_GEAR_PIN}, {RIGHT_GEAR_PIN}")
-            elif function == "Nav Light Toggle":
-                # Configure all three nav light pins
-                config_data[str(LEFT_NAV_PIN)] = function
-                config_data[str(RIGHT_NAV_PIN)] = f"{function} (Right)"
-                config_data[str(TAIL_NAV_PIN)] = f"{function} (Tail)"
-                logger.info(f"Configured nav light pins: {LEFT_NAV_PIN}, {RIGHT_NAV_PIN}, {TAIL_NAV_PIN}")
-            elif function == "Analog Input Module":
-                # Configure the analog input module (uses pin identifier for both I2C pins)
-                config_data[ANALOG_INPUT_MODULE_ID] = function
-                logger.info(f"Configured Analog Input Module (I2C pins 2&3)")
-            else:
-                # Standard single pin configuration
-                config_data[pin] = function
-                logger.info(f"Configured pin {pin} as {function}")
-
-            # Special handling for mic control - start/stop checking based on configuration
-            if function == "Mic Control" and not SIMULATED_MODE:
-                logger.info("Starting mic check for newly configured mic control")
-                self.start_mic_check()
-
-            save_config(config_data)
-            self.load_gpio_controls()
-            self.update_overlay_status()
-            
-            # Check if we need to restore fullscreen mode
-            was_fullscreen = getattr(self.config_window, '_was_fullscreen', False)
-            self.config_window.destroy()
-            
-            # Restore fullscreen mode if it was active before
-            if was_fullscreen and hasattr(self, 'fullscreen') and not self.fullscreen:
-                logger.info("Restoring fullscreen mode after config window closed")
-                self.root.after(100, self.toggle_fullscreen)  # Small delay to ensure window is destroyed
-
-        # Buttons with larger, more touch-friendly size
-        # Use tk.Frame when we need background color, as TTK frames don't support bg option
-        button_frame = tk.Frame(main_frame, bg="#1e1e2e")
-        button_frame.pack(fill=tk.X, pady=(20, 0))
-
-        save_button = self.Button(
-            button_frame,
-            text="Save",
-            command=save_assignment,
-            style="success.TButton",
-            width=15
-        )
-        save_button.pack(side=tk.LEFT, padx=5, expand=True)
-
-        clear_button = self.Button(
-            button_frame,
-            text="Clear All Configs",
-            command=self.clear_all_configs,
-            style="danger.TButton",
-            width=15
-        )
-        clear_button.pack(side=tk.LEFT, padx=5, expand=True)
-        
-        # Teacher Mode button
-        teacher_button = self.Button(
-            button_frame,
-            text="Teacher Mode",
-            command=lambda: show_teacher_password_dialog(self),
-            style="warning.TButton",
-            width=15
-        )
-        teacher_button.pack(side=tk.RIGHT, padx=5, expand=True)
+            geometry = f'{width}x{height}+{x}+{y}'
+            window.geometry(geometry)
+            logger.info(f"Config window positioned at {x},{y} ({width}x{height})")
+            return geometry
+
+        # Center the window. The window size and the screen are fixed, so the
+        # position is only measured on the first open.
+        if self._config_geometry_cached:
+            self.config_window.geometry(self._config_geometry_cached)
+        else:
+            self._config_geometry_cached = center_window(self.config_window)
+
+        # Raise, grab and focus in one batch once the window is mapped: right away
+        # if it was already showing, otherwise from its <Map> binding
+        if already_mapped:
+            _raise_config_window(self)
+        else:
+            self._config_raise_pending = True
+
+        # Some Linux/Pi window managers restack a freshly mapped window, so
+        # raise it once more after they settle instead of retrying inline
+        if _IS_LINUX:
+            self.config_window.after(100, self.config_window.lift)
 
         logger.info("Configuration window opened")
 
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 # UI Configuration
 BOOTSTRAP_AVAILABLE = True
 
@@ -19,25 +21,64 @@ ADS_SIGNAL_CHANNEL = 1   # ADS.P1 - Signal Quality (Coax)
 ADS_POT_CHANNEL = 2      # ADS.P2 - Potentiometer
 ADS_TEMP_CHANNEL = 3     # ADS.P3 - Temperature Sensor (10K thermistor)
 
+# Coax signal voltage shown as 100% signal quality
+SIGNAL_FULL_SCALE_V = 3.3
+# Signal quality percent per volt of coax signal
+SIGNAL_PCT_PER_VOLT = 100.0 / SIGNAL_FULL_SCALE_V
+
 # Special identifier for Analog Input Module (uses both I2C pins)
 ANALOG_INPUT_MODULE_ID = "2,3"
 
-# Pin labels
-PIN_LABELS = {
+# Pin labels (read-only)
+PIN_LABELS = MappingProxyType({
     NOSE_GEAR_PIN: "Nose Gear",
     LEFT_GEAR_PIN: "Left Gear",
     RIGHT_GEAR_PIN: "Right Gear",
     LEFT_NAV_PIN: "Left Nav",
     RIGHT_NAV_PIN: "Right Nav",
     TAIL_NAV_PIN: "Tail Nav"
-}
+})
+
+# Input pins shown as indicators on the airplane diagram
+INDICATOR_PINS = (
+    NOSE_GEAR_PIN, LEFT_GEAR_PIN, RIGHT_GEAR_PIN,
+    LEFT_NAV_PIN, RIGHT_NAV_PIN, TAIL_NAV_PIN
+)
+
+# Debounce window for GPIO edge detection (milliseconds)
+EDGE_BOUNCE_MS = 20
 
 # Pins to monitor
-MONITORING_PINS = [
+MONITORING_PINS = (
     NOSE_GEAR_PIN, LEFT_GEAR_PIN, RIGHT_GEAR_PIN,
     LEFT_NAV_PIN, RIGHT_NAV_PIN, TAIL_NAV_PIN,
     MIC_CONTROL_PIN
-]
+)
+
+# GPIO pins offered for user-assigned functions (monitoring pins excluded)
+ALL_GPIO_PINS = (5, 6, 12, 16, 20, 21, 25)
+
+# Predefined functions with fixed pins (read-only)
+PREDEFINED_FUNCTION_PINS = MappingProxyType({
+    "Landing Gear Control": str(NOSE_GEAR_PIN),
+    "Nav Light Toggle": str(LEFT_NAV_PIN),
+    "Mic Control": str(MIC_CONTROL_PIN),
+    "Analog Input Module": ANALOG_INPUT_MODULE_ID
+})
+
+# Functions offered in the configuration window
+PREDEFINED_FUNCTIONS = (
+    "Analog Input Module",
+    "Mic Control",
+    "Nav Light Toggle",
+    "Landing Gear Control",
+    "Rotary Switch",
+    "Relay Control",
+    "Lighting Control",
+    "Speed Sensor",
+    "Light Sensor",
+    "Strobe Light"
+)
 
 # Config file name
 CONFIG_FILE = "gpio_config.json" 
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+import functools
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
@@ -6,36 +7,224 @@ import sys
 import traceback
 import math
 import time
+import tempfile
 import threading
+from array import array
 from gpio_handler import initialize_gpio, cleanup_gpio, SIMULATED_MODE, GPIO, PIN_STATES
+from gpio_handler import ADS_LIBRARY, board, busio, ADS, AnalogIn
 from config_manager import load_config, save_config, config_data, clear_config_on_startup
-from utils import is_function_configured, is_mic_and_analog_configured, toggle_gpio_state, get_app_version
+from utils import toggle_gpio_state, get_app_version
 from constants import *
 try:
     from PIL import Image, ImageTk
 except ImportError:
     Image = None
     ImageTk = None
+
+# Resolve the LANCZOS filter once (Pillow >= 9.1 moved it under Image.Resampling)
+if Image is not None:
+    try:
+        _LANCZOS = Image.Resampling.LANCZOS
+    except AttributeError:
+        _LANCZOS = Image.LANCZOS
+else:
+    _LANCZOS = None
 logger = logging.getLogger("GPIO_Control")
 
+# Gauge needle direction for each whole percent: 0% points full left (180 degrees),
+# 100% full right (0 degrees)
+_GAUGE_COS = tuple(math.cos(math.radians(180 - v * 1.8)) for v in range(101))
+_GAUGE_SIN = tuple(math.sin(math.radians(180 - v * 1.8)) for v in range(101))
+
+
+# ADS1115 16-bit reading to percent / volts (3.3V reference), and the analog
+# smoothing shift: each new sample gets a weight of 1 / 2**_EMA_SHIFT
+_ADC_TO_PCT = 100.0 / 65535
+_ADC_TO_VOLTS = 3.3 / 65535
+_EMA_SHIFT = 2
+# Thermistor lookup resolution: one table entry per 2**_THERMISTOR_SHIFT ADC counts
+_THERMISTOR_SHIFT = 4
+# 10K thermistor constants for the simplified Steinhart-Hart (beta) equation:
+# 1/T0 at 25°C, 1/Beta and ln(R0)
+_INV_T0 = 1 / 298.15
+_INV_BETA = 1 / 3950
+_LOG_R0 = math.log(10000)
+# ADS1115 polling interval while any input is moving, and once all are steady
+# (a reading within _ANALOG_STEADY_PCT of its smoothed value counts as steady)
+_ANALOG_ACTIVE_S = 0.05
+_ANALOG_IDLE_S = 0.2
+_ANALOG_STEADY_PCT = 0.5
+_ANALOG_STEADY_RAW = int(_ANALOG_STEADY_PCT / _ADC_TO_PCT)
+# ADS1115 samples per second for the gauge channels (the chip's fastest rate)
+_ADS_DATA_RATE = 860
+
+# Mouse wheel event flavour, resolved once: macOS and Windows send <MouseWheel>
+# with a delta (Windows in multiples of 120), X11 sends <Button-4>/<Button-5>
+_WHEEL_PLATFORM = "mac" if sys.platform == "darwin" else "win" if sys.platform.startswith("win") else "x11"
+
+
+def _needle_table(cx, cy, r):
+    """Return the needle line coordinates for every whole percent 0-100"""
+    return tuple((cx, cy, cx + r * c, cy - r * s) for c, s in zip(_GAUGE_COS, _GAUGE_SIN))
+
+
+class _Gauge:
+    """Widgets and redraw state of one dial gauge (slotted: read on every redraw)"""
+    __slots__ = ('canvas', 'needle', 'value_label', 'realtime_label', 'center_x', 'center_y', 'radius',
+                 'needle_coords', 'set_needle', 'set_value_text', 'set_realtime_text', 'percent', 'last')
+
+    def __init__(self, canvas, needle, value_label, realtime_label, value_text, realtime_text, cx, cy, r):
+        self.canvas = canvas
+        self.needle = needle
+        self.value_label = value_label
+        self.realtime_label = realtime_label
+        self.center_x = cx
+        self.center_y = cy
+        self.radius = r
+        self.needle_coords = _needle_table(cx, cy, r)
+        # Raw Tcl coords call: skips Canvas.coords' argument flattening and the
+        # float list it parses back out of every call
+        self.set_needle = functools.partial(canvas.tk.call, str(canvas), "coords", needle)
+        # Label texts are set through their variables, one Tcl setvar per change
+        self.set_value_text = value_text.set
+        self.set_realtime_text = realtime_text.set
+        self.percent = 0  # Whole percent the needle and percent label show
+        self.last = None  # Last displayed step, used to skip unchanged redraws
+
+
+def _needle_coords(gauge, value):
+    """Return the needle line coordinates for a gauge showing value percent"""
+    i = int(value)
+    return gauge.needle_coords[0 if i < 0 else 100 if i > 100 else i]
+
+
+def _sweep_frames(steps):
+    """Startup sweep frames: per step, the (value, readout) drawn on the POT, TEMP and AUX gauges"""
+    frames = []
+    half = steps // 2
+    for step in range(steps + 1):
+        # Sweep from 0% to 100%, then back to 0%
+        progress = (step if step <= half else steps - step) / half * 100
+        # The sweep's temperature readout runs from -20°C
+        frames.append(((progress, _pot_text(progress)), (progress, f"{progress - 20:.1f}°C"), (progress, None)))
+    return tuple(frames)
+
+
+def _thermistor_pct(temp_voltage):
+    """Temperature gauge percent (0-100°C) for a 10K thermistor divider voltage"""
+    # Calculate resistance of thermistor (assuming voltage divider with 10K fixed resistor)
+    # V_out = V_cc * R_thermistor / (R_fixed + R_thermistor)
+    # R_thermistor = R_fixed * V_out / (V_cc - V_out)
+    if temp_voltage < 3.2:  # Avoid division by very small numbers
+        r_fixed = 10000  # 10K fixed resistor
+        r_thermistor = r_fixed * temp_voltage / (3.3 - temp_voltage)
+
+        # Convert resistance to temperature using Steinhart-Hart equation (simplified)
+        # For typical 10K thermistor: Beta = ~3950K, R0 = 10K at 25°C
+        try:
+            temp_k = 1 / (_INV_T0 + _INV_BETA * (math.log(r_thermistor) - _LOG_R0))
+            temp_celsius = temp_k - 273.15
+        except (ValueError, ZeroDivisionError):
+            temp_celsius = 25  # Default to room temperature on error
+    else:
+        temp_celsius = 25  # Default if voltage too high
+
+    # Scale to 0-100% for gauge display (0°C = 0%, 100°C = 100%)
+    return min(max((temp_celsius / 100) * 100, 0), 100)
+
+
+def _thermistor_table():
+    """Gauge percent for every ADC reading >> _THERMISTOR_SHIFT"""
+    step = 1 << _THERMISTOR_SHIFT
+    return array('f', (_thermistor_pct(i * step * _ADC_TO_VOLTS) for i in range(65536 // step)))
+
+
+def _pot_text(value):
+    """Real-time POT reading: 0-100% maps to 0-10k ohms"""
+    resistance = int(value * 100)
+    return f"{resistance/1000:.1f}kΩ" if resistance >= 1000 else f"{resistance}Ω"
+
+
+def _temp_text(value):
+    """Real-time TEMP reading: 0-100% maps to 0-100°C"""
+    return f"{value:.1f}°C"
+
+
+_SWEEP_FRAMES = _sweep_frames(50)
+
+
+def _draw_gauge(gauge, value, realtime_text=None):
+    """Point a gauge's needle at value percent and refresh its labels"""
+    # The needle and percent label only move in whole percents
+    percent = int(value)
+    if percent != gauge.percent:
+        gauge.percent = percent
+        gauge.set_needle(*_needle_coords(gauge, value))
+        gauge.set_value_text(f"{percent}%")
+    if realtime_text is not None:
+        gauge.set_realtime_text(realtime_text)
+
+
+def _update_gauge(gauge, value, step, realtime_text=None):
+    """Redraw a gauge unless its displayed step is unchanged since the last redraw"""
+    if not gauge or step == gauge.last:
+        return
+    gauge.last = step
+    _draw_gauge(gauge, value, realtime_text(value) if realtime_text else None)
+
+
+def refresh_configured_functions(self):
+    """Cache the set of configured functions so hot paths test membership instead of scanning config_data"""
+    self._configured_functions = frozenset(config_data.values())
+    # The coax signal is read through the Analog Input Module
+    self._coax_configured = "Analog Input Module" in self._configured_functions
+    # Mic keying needs both the mic pin and the ADC that samples the audio level
+    self._mic_and_analog_configured = self._coax_configured and "Mic Control" in self._configured_functions
+
 
 def load_gpio_controls(self):
     """Load and display all configured GPIO controls"""
     try:
         logger.info("Loading GPIO controls")
-
-        # Clear existing controls
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-
-        # Create controls for each configured GPIO
+        self.refresh_configured_functions()
+
+        # Hide controls for pins that were deleted or reassigned and keep their rows
+        # for reuse; the rest are kept as-is
+        for pin, (row, function) in list(self._pin_widgets.items()):
+            if config_data.get(pin) != function:
+                row['frame'].pack_forget()
+                row['pin'] = row['function'] = None
+                self._gpio_row_pool.append(row)
+                del self._pin_widgets[pin]
+
+        # Create controls for newly configured GPIOs. Failures are collected and
+        # reported in one dialog instead of one modal dialog per pin.
+        self._load_errors = []
+        self._pending_pin_setup = []
         for pin, function in config_data.items():
-            logger.debug(f"Creating control for {function} on pin {pin}")
+            if pin in self._pin_widgets:
+                continue
+            logger.debug("Creating control for %s on pin %s", function, pin)
             try:
                 self.create_gpio_control(pin, function)
             except Exception as e:
-                logger.error(f"Error creating control for pin {pin}: {e}")
-                logger.error(traceback.format_exc())
+                # exc_info lets logging format the traceback only if a handler emits it
+                logger.error("Error creating control for pin %s: %s", pin, e, exc_info=True)
+                self._load_errors.append((pin, str(e)))
+
+        # The scroll region follows main_frame's <Configure> once Tk lays out the new controls
+
+        # Configure the new pins' hardware in one batch. This stays on the Tk thread:
+        # RPi.GPIO is not driven from more than one thread, and a row cannot be
+        # clicked before its pin is set up.
+        if self._pending_pin_setup:
+            pins = self._pending_pin_setup
+            self._pending_pin_setup = []
+            self.setup_gpio_pins(pins)
+
+        if self._load_errors:
+            details = "\n".join(f"Pin {pin}: {message}" for pin, message in self._load_errors)
+            messagebox.showerror("Error", f"Failed to create controls:\n{details}", parent=self.root)
 
         logger.info("GPIO controls loaded")
     except Exception as e:
@@ -44,128 +233,143 @@ def load_gpio_controls(self):
         messagebox.showerror("Error", f"Failed to load GPIO controls: {e}", parent=self.root)
 
 
+def _acquire_gpio_row(self, pin, function, text, status_text):
+    """Show a control row for pin, reusing a hidden one when available"""
+    if self._gpio_row_pool:
+        row = self._gpio_row_pool.pop()
+    else:
+        outer_frame = self.Frame(self.main_frame)
+        frame = self.Frame(outer_frame, relief="ridge")
+        frame.pack(fill=tk.X, expand=True, padx=8, pady=8)
+
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_columnconfigure(1, weight=0)
+
+        row = {'frame': outer_frame, 'pin': None, 'function': None}
+
+        # The commands read the row's current pin, so a reused row needs no new Tcl commands
+        btn = self.Button(frame,
+                         command=lambda: toggle_gpio_state(row['pin'], btn, status_label, row['function'], self),
+                         style="success.TButton")
+        btn.grid(row=0, column=0, padx=5, pady=5, sticky="w")
+
+        delete_btn = self.Button(frame, text="Delete",
+                                command=lambda: self.delete_gpio(row['pin']),
+                                style="danger.TButton")
+        delete_btn.grid(row=0, column=1, padx=5, pady=5, sticky="e")
+
+        status_label = self.Label(frame, style="info.TLabel", anchor="center", justify="center")
+        status_label.grid(row=1, column=0, columnspan=2, padx=5, sticky="nsew")
+
+        row['btn'] = btn
+        row['status'] = status_label
+
+    row['pin'] = pin
+    row['function'] = function
+    row['btn'].configure(text=text, style="success.TButton")
+    row['status'].configure(text=status_text)
+    row['frame'].pack(fill=tk.X, expand=True, padx=5, pady=5)
+    self._pin_widgets[pin] = (row, function)
+    return row
+
+
 def create_gpio_control(self, pin, function):
     """Create a GPIO control UI element"""
     try:
         # Special handling for Analog Input Module (uses I2C pins 2,3)
         if function == "Analog Input Module":
-            logger.info(f"Creating control for {function} (I2C pins 2&3)")
+            logger.info("Creating control for %s (I2C pins 2&3)", function)
             
             # No GPIO setup needed - I2C is handled automatically by ADS1115 library
             # Just create the UI element
             
             # Create the UI element
-            outer_frame = self.Frame(self.main_frame)
-            outer_frame.pack(fill=tk.X, expand=True, padx=5, pady=5)
-
-            if BOOTSTRAP_AVAILABLE:
-                frame = self.Frame(outer_frame, relief="ridge")
-                frame.pack(fill=tk.X, expand=True, padx=8, pady=8)
-            else:
-                frame = self.Frame(outer_frame, relief="ridge")
-                frame.pack(fill=tk.X, expand=True, padx=8, pady=8)
-
-            frame.grid_columnconfigure(0, weight=1)
-            frame.grid_columnconfigure(1, weight=0)
-
-            btn = self.Button(frame, text=f"{function} (I2C)",
-                             command=lambda: toggle_gpio_state(pin, btn, status_label, function, self),
-                             style="success.TButton")
-            btn.grid(row=0, column=0, padx=5, pady=5, sticky="w")
-
-            delete_btn = self.Button(frame, text="Delete",
-                                    command=lambda: self.delete_gpio(pin),
-                                    style="danger.TButton")
-            delete_btn.grid(row=0, column=1, padx=5, pady=5, sticky="e")
-
-            status_label = self.Label(frame, text="Status: I2C Active | Monitoring: Ready",
-                                     style="info.TLabel", anchor="center", justify="center")
-            status_label.grid(row=1, column=0, columnspan=2, padx=5, sticky="nsew")
+            _acquire_gpio_row(self, pin, function, f"{function} (I2C)",
+                              "Status: I2C Active | Monitoring: Ready")
 
             # Start analog monitoring for gauges
             logger.info("Analog Input Module configured - starting analog monitoring")
             self.start_analog_monitoring()
-            
-            # Force update of the canvas
-            if hasattr(self, 'main_canvas'):
-                self.main_canvas.update_idletasks()
-                self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
-            
+
             return  # Exit early for Analog Input Module
         
         # Regular pin processing for other functions
         pin = int(pin)
-        logger.info(f"Creating control for {function} on pin {pin}")
-
-        # First, ensure the pin is in a clean state
-        if not SIMULATED_MODE:
-            try:
-                GPIO.cleanup(pin)
-            except:
-                pass  # Ignore cleanup errors for pins that weren't set up
-
-        # Configure the GPIO pin - SPECIAL HANDLING FOR MIC CONTROL
-        if function == "Mic Control" and int(pin) == MIC_CONTROL_PIN:
-            # Keep mic pin as INPUT with pull-up
-            GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            logger.info(f"Configured mic pin {pin} as INPUT with pull-up")
-        elif function in ["Landing Gear Control",
-                          "Nav Light Toggle"] or "Landing Gear" in function or "Nav Light" in function:
-            # Keep these pins as INPUT with pull-up
-            GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            logger.info(f"Configured {function} pin {pin} as INPUT with pull-up")
-        else:
-            # Configure other pins as OUTPUT
-            GPIO.setup(pin, GPIO.OUT)
-            GPIO.output(pin, False)
+        logger.info("Creating control for %s on pin %s", function, pin)
 
+        # The GPIO setup itself runs in setup_gpio_pins once every control is created
+        self._pending_pin_setup.append((pin, function))
         PIN_STATES[pin] = False
 
         # Create the UI element
-        outer_frame = self.Frame(self.main_frame)
-        outer_frame.pack(fill=tk.X, expand=True, padx=5, pady=5)
+        row = _acquire_gpio_row(self, pin, function, f"{function} ({pin})",
+                                "Status: OFF | Signal: Inactive")
 
-        if BOOTSTRAP_AVAILABLE:
-            frame = self.Frame(outer_frame, relief="ridge")
-            frame.pack(fill=tk.X, expand=True, padx=8, pady=8)
-        else:
-            frame = self.Frame(outer_frame, relief="ridge")
-            frame.pack(fill=tk.X, expand=True, padx=8, pady=8)
+        # Store specific control references as needed
+        if function == "Mic Control":
+            logger.info("Mic control configured - setting up monitoring")
+            self.mic_status_label = row['status']
+            # save_assignment starts the mic check once the reload is done
 
-        frame.grid_columnconfigure(0, weight=1)
-        frame.grid_columnconfigure(1, weight=0)
+    except Exception as e:
+        logger.error("Error creating GPIO control for pin %s: %s", pin, e, exc_info=True)
+        # Reported by load_gpio_controls once every pin has been tried
+        self._load_errors.append((pin, str(e)))
 
-        btn = self.Button(frame, text=f"{function} ({pin})",
-                         command=lambda: toggle_gpio_state(pin, btn, status_label, function, self),
-                         style="success.TButton")
-        btn.grid(row=0, column=0, padx=5, pady=5, sticky="w")
 
-        delete_btn = self.Button(frame, text="Delete",
-                                command=lambda: self.delete_gpio(pin),
-                                style="danger.TButton")
-        delete_btn.grid(row=0, column=1, padx=5, pady=5, sticky="e")
+def setup_gpio_pins(self, pins):
+    """Configure the GPIO hardware for newly created controls"""
+    errors = []
+    indicator_pins = []
+    for pin, function in pins:
+        try:
+            if _setup_gpio_pin(self, pin, function):
+                indicator_pins.append(pin)
+        except Exception as e:
+            logger.error("Error setting up GPIO pin %s: %s", pin, e, exc_info=True)
+            errors.append((pin, str(e)))
 
-        status_label = self.Label(frame, text="Status: OFF | Signal: Inactive",
-                                 style="info.TLabel", anchor="center", justify="center")
-        status_label.grid(row=1, column=0, columnspan=2, padx=5, sticky="nsew")
+    # The cleanup in _setup_gpio_pin dropped any edge detection, so arm the
+    # indicator inputs once the whole batch is configured
+    for pin in indicator_pins:
+        self.watch_indicator_pin(pin)
 
-        # Store specific control references as needed
-        if function == "Mic Control":
-            logger.info("Mic control configured - setting up monitoring")
-            self.mic_status_label = status_label
-            # Start checking mic pin if on real hardware
-            if not SIMULATED_MODE:
-                self.start_mic_check()
+    # Indicator inputs may have changed mode, so redraw them
+    self.update_indicators()
+    if errors:
+        details = "\n".join(f"Pin {pin}: {message}" for pin, message in errors)
+        messagebox.showerror("Error", f"Failed to set up GPIO pins:\n{details}", parent=self.root)
 
-        # Force update of the canvas
-        if hasattr(self, 'main_canvas'):
-            self.main_canvas.update_idletasks()
-            self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
 
-    except Exception as e:
-        logger.error(f"Error creating GPIO control for pin {pin}: {e}")
-        logger.error(traceback.format_exc())
-        messagebox.showerror("Error", f"Failed to create control for pin {pin}: {e}", parent=self.root)
+def _setup_gpio_pin(self, pin, function):
+    """Put one pin into the input or output mode its function needs; True for indicator inputs"""
+    # The cached level is stale once the pin is cleaned up
+    self._pin_cache.pop(pin, None)
+
+    # First, ensure the pin is in a clean state
+    if not SIMULATED_MODE:
+        try:
+            GPIO.cleanup(pin)
+        except:
+            pass  # Ignore cleanup errors for pins that weren't set up
+
+    # Configure the GPIO pin - SPECIAL HANDLING FOR MIC CONTROL
+    if function == "Mic Control" and int(pin) == MIC_CONTROL_PIN:
+        # Keep mic pin as INPUT with pull-up
+        GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+        logger.info("Configured mic pin %s as INPUT with pull-up", pin)
+    elif function in ["Landing Gear Control",
+                      "Nav Light Toggle"] or "Landing Gear" in function or "Nav Light" in function:
+        # Keep these pins as INPUT with pull-up
+        GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+        logger.info("Configured %s pin %s as INPUT with pull-up", function, pin)
+        # setup_gpio_pins re-arms edge detection once the batch is done
+        return True
+    else:
+        # Configure other pins as OUTPUT
+        GPIO.setup(pin, GPIO.OUT)
+        GPIO.output(pin, False)
+    return False
 
 
 def setup_gpio_area(self, parent):
@@ -182,27 +386,66 @@ def setup_gpio_area(self, parent):
 
         self.main_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # Configure scrolling with mousewheel
-        def _on_mousewheel(event):
-            if sys.platform == "darwin":  # macOS
-                self.main_canvas.yview_scroll(int(-1 * event.delta), "units")
-            elif sys.platform.startswith("win"):  # Windows
-                self.main_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            else:  # Linux
-                if event.num == 4:
-                    self.main_canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    self.main_canvas.yview_scroll(1, "units")
-
-        # Bind mousewheel and scroll events
-        self.main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        self.main_canvas.bind_all("<Button-4>", _on_mousewheel)
-        self.main_canvas.bind_all("<Button-5>", _on_mousewheel)
-
-        # Update scroll region when content changes
+        # Configure scrolling with mousewheel (handler picked once for this platform).
+        # The wheel events go to whichever control is under the pointer, so the
+        # handlers are bound app-wide, but only while the pointer is over the GPIO
+        # list. Each handler is registered as a Tcl command once and <Enter>/<Leave>
+        # just swap the binding script, so wheel events elsewhere never reach
+        # Python and no Tcl command is registered per bind.
+        yview_scroll = self.main_canvas.yview_scroll
+
+        # One specialised handler per event sequence, so none of them branch on
+        # the platform or the button number at scroll time
+        if _WHEEL_PLATFORM == "mac":
+            def _on_mousewheel(delta):
+                yview_scroll(-int(delta), "units")
+        else:
+            def _on_mousewheel(delta):
+                yview_scroll(int(-int(delta) / 120), "units")
+        wheel_scripts = {"<MouseWheel>": f"{self.root.register(_on_mousewheel)} %D"}
+        if _WHEEL_PLATFORM == "x11":
+            # Tk 8.6 on X11 reports the wheel as buttons 4/5; newer Tk
+            # versions send <MouseWheel> like Windows
+            wheel_scripts["<Button-4>"] = self.root.register(lambda: yview_scroll(-1, "units"))
+            wheel_scripts["<Button-5>"] = self.root.register(lambda: yview_scroll(1, "units"))
+
+        tk_call = self.main_canvas.tk.call
+
+        def _set_wheel_bindings(active):
+            for sequence, script in wheel_scripts.items():
+                tk_call("bind", "all", sequence, script if active else "")
+
+        def _wheel_enter(event):
+            _set_wheel_bindings(True)
+
+        def _wheel_leave(event):
+            # Moving onto one of the controls inside the canvas also reports a Leave
+            x, y = self.main_canvas.winfo_pointerxy()
+            under = self.main_canvas.winfo_containing(x, y)
+            if under is None or not str(under).startswith(str(self.main_canvas)):
+                _set_wheel_bindings(False)
+
+        self.main_canvas.bind("<Enter>", _wheel_enter)
+        self.main_canvas.bind("<Leave>", _wheel_leave)
+
+        # Update scroll region when content changes. Packing several controls fires
+        # <Configure> once per control, so coalesce them into one idle update.
+        scroll_region_pending = False
+        scroll_size = (400, 340)
+
+        def _apply_scroll_region():
+            nonlocal scroll_region_pending
+            scroll_region_pending = False
+            # The inner frame is the canvas's only item and sits at (0, 0), so its
+            # size from the last <Configure> is the scroll region; no bbox query needed
+            self.main_canvas.configure(scrollregion=(0, 0) + scroll_size)
+
         def _configure_scroll_region(event):
-            # Expand canvas scrollregion to match the size of the inner frame
-            self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
+            nonlocal scroll_region_pending, scroll_size
+            scroll_size = (event.width, event.height)
+            if not scroll_region_pending:
+                scroll_region_pending = True
+                self.main_canvas.after_idle(_apply_scroll_region)
 
         self.main_frame.bind("<Configure>", _configure_scroll_region)
 
@@ -223,6 +466,8 @@ def draw_square(self, name, x, y, size=10, color="red"):
         half = size // 2
         self.indicators[name] = self.canvas.create_rectangle(x - half, y - half, x + half, y + half, fill=color,
                                                              outline="")
+        # Seed the fill cache so the first refresh skips indicators already drawn in the right color
+        self._last_fill[self.indicators[name]] = color
     except Exception as e:
         logger.error(f"Error drawing square indicator {name}: {e}")
 
@@ -231,6 +476,7 @@ def draw_circle(self, name, x, y, r=5, color="gray"):
     """Draw a circular indicator on the canvas"""
     try:
         self.indicators[name] = self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=color, outline="")
+        self._last_fill[self.indicators[name]] = color
     except Exception as e:
         logger.error(f"Error drawing circle indicator {name}: {e}")
 
@@ -249,7 +495,8 @@ def create_gauge(self, parent, x, y, label, color):
         main_label.pack()
         
         # Create real-time value display next to the main label
-        realtime_label = self.Label(gauge_frame, text="--", font=("Arial", 8), 
+        realtime_text = tk.StringVar(value="--")
+        realtime_label = self.Label(gauge_frame, textvariable=realtime_text, font=("Arial", 8), 
                                    foreground="white", background='#1e1e2e')
         realtime_label.pack()
         
@@ -261,30 +508,27 @@ def create_gauge(self, parent, x, y, label, color):
         canvas.create_arc(10, 10, 90, 90, start=0, extent=180, fill='#2a2a3c', outline='#3a3a4c')
         
         # Draw gauge needle (initially at full left - 0 degrees)
-        start_angle = math.radians(180)  # Start at full left
-        start_x = 50 + (30 * math.cos(start_angle))
-        start_y = 50 - (30 * math.sin(start_angle))
-        needle = canvas.create_line(50, 50, start_x, start_y, fill=color, width=2)
+        needle = canvas.create_line(*_needle_table(50, 50, 30)[0], fill=color, width=2)
         
         # Create percentage label with matching theme and bold font
-        value_label = self.Label(gauge_frame, text="0%", font=("Arial", 12, "bold"), 
+        value_text = tk.StringVar(value="0%")
+        value_label = self.Label(gauge_frame, textvariable=value_text, font=("Arial", 12, "bold"), 
                                foreground=color, background='#1e1e2e')
         value_label.pack()
         
-        return {
-            'canvas': canvas,
-            'needle': needle,
-            'value_label': value_label,
-            'realtime_label': realtime_label,
-            'center_x': 50,
-            'center_y': 50,
-            'radius': 30
-        }
+        return _Gauge(canvas, needle, value_label, realtime_label, value_text, realtime_text, 50, 50, 30)
     except Exception as e:
         logger.error(f"Error creating gauge: {e}")
         return None
 
 
+def _fixed_cell(parent, row, height):
+    """Grid a 160px-wide frame of fixed height into parent's column 0"""
+    cell = tk.Frame(parent, width=160, height=height, bg="#1e1e2e")
+    cell.grid(row=row, column=0)
+    return cell
+
+
 def setup_control_panel(self, parent):
     """Set up the visual control panel with aircraft diagram"""
     try:
@@ -300,27 +544,41 @@ def setup_control_panel(self, parent):
                                          style="primary.TButton")
         self.config_button.place(x=30, y=-4, width=260)  # Span almost full width at top
 
+        # Left column (airplane canvas, signal/audio meters, key status) is a static
+        # stack, so lay it out with grid inside one placed frame. Row heights keep
+        # the original pixel spacing: canvas 40-200, label 200-220, meters at 220/260.
+        left_column = tk.Frame(control_panel, bg="#1e1e2e")
+        left_column.place(x=20, y=40)  # Below the config button
+        # The rows under the canvas are fixed-size cells; widgets placed inside do
+        # not propagate their size, so a taller label cannot push the meters off
+        # the pixel positions their "not configured" overlays are placed at
+        signal_cell, signal_meter_cell, audio_meter_cell, key_cell = (
+            _fixed_cell(left_column, row, height) for row, height in ((1, 20), (2, 40), (3, 30), (4, 20)))
+
         # Canvas for airplane visualization
-        self.canvas = tk.Canvas(control_panel, width=160, height=160, bg="#1e1e2e", highlightthickness=0)
-        self.canvas.place(x=20, y=40)  # Move down to make room for config button
+        self.canvas = tk.Canvas(left_column, width=160, height=160, bg="#1e1e2e", highlightthickness=0)
+        self.canvas.grid(row=0, column=0)
 
-        # Try to load airplane image (existing code remains the same)
+        # Try to load airplane image. A pre-sized 160x160 copy ships next to the
+        # original and Tk reads PNG natively, so startup needs no PIL at all;
+        # otherwise resize once with PIL and cache the result in the temp directory.
         airplane_path = os.path.join(script_dir, "Airplaneoutline.png")
+        airplane_160_path = os.path.join(script_dir, "Airplaneoutline_160.png")
         logger.debug(f"Looking for image at: {airplane_path}")
 
         try:
-            if 'Image' in globals():
-                resampling_method = hasattr(Image, 'Resampling') and Image.Resampling.LANCZOS or Image.LANCZOS
-                if os.path.exists(airplane_path):
-                    plane_img = Image.open(airplane_path).resize((160, 160), resampling_method)
-                    self.airplane_photo = ImageTk.PhotoImage(plane_img)
-                    self.canvas.create_image(0, 0, anchor="nw", image=self.airplane_photo)
-                    logger.info("Airplane image loaded successfully")
-                else:
-                    logger.warning(f"Airplane image not found at {airplane_path}")
-                    self.canvas.create_text(80, 80, text="[AIRPLANE IMG MISSING]", fill="orange")
+            if not os.path.exists(airplane_160_path) and os.path.exists(airplane_path) and Image is not None:
+                airplane_160_path = os.path.join(tempfile.gettempdir(), "tava_airplane_160.png")
+                # Rebuild the cached copy if the source image was replaced since
+                if (not os.path.exists(airplane_160_path)
+                        or os.path.getmtime(airplane_160_path) < os.path.getmtime(airplane_path)):
+                    Image.open(airplane_path).resize((160, 160), _LANCZOS).save(airplane_160_path)
+            if os.path.exists(airplane_160_path):
+                self.airplane_photo = tk.PhotoImage(file=airplane_160_path)
+                self.canvas.create_image(0, 0, anchor="nw", image=self.airplane_photo)
+                logger.info("Airplane image loaded successfully")
             else:
-                logger.warning("PIL not available - airplane image cannot be displayed")
+                logger.warning(f"Airplane image not found at {airplane_path} (or PIL unavailable to resize it)")
                 self.canvas.create_text(80, 80, text="[AIRPLANE IMG MISSING]", fill="orange")
         except Exception as e:
             logger.error(f"Airplane image error: {e}")
@@ -334,22 +592,45 @@ def setup_control_panel(self, parent):
         self.draw_circle("nav_right", 148, 100)
         self.draw_circle("nav_tail", 80, 140)
 
+        # Resolve each indicator's canvas item, pin and colors once:
+        # (function, item_id, pin, colors) where colors is indexed by pin state,
+        # i.e. (color when LOW, color when HIGH)
+        gear_colors = ("red", "green")
+        nav_colors = ("gray", "yellow")
+        self._indicator_spec = (
+            ("Landing Gear Control", self.indicators["nose"], NOSE_GEAR_PIN, gear_colors),
+            ("Landing Gear Control", self.indicators["left"], LEFT_GEAR_PIN, gear_colors),
+            ("Landing Gear Control", self.indicators["right"], RIGHT_GEAR_PIN, gear_colors),
+            ("Nav Light Toggle", self.indicators["nav_left"], LEFT_NAV_PIN, nav_colors),
+            ("Nav Light Toggle", self.indicators["nav_right"], RIGHT_NAV_PIN, nav_colors),
+            ("Nav Light Toggle", self.indicators["nav_tail"], TAIL_NAV_PIN, nav_colors)
+        )
+        # Pre-bound Tcl "itemconfigure" for indicator fills; skips the Python-side
+        # option-dict marshaling that canvas.itemconfig does on every call
+        self._set_indicator_fill = functools.partial(self.canvas.tk.call, str(self.canvas), "itemconfigure")
+
         # Status display elements (adjust Y positions)
-        self.signal_quality_label = self.tkLabel(control_panel, text="Signal Quality: N/A", font=("Arial", 12),
+        self.signal_quality_text = tk.StringVar(value="Signal Quality: N/A")
+        self.signal_quality_label = self.tkLabel(signal_cell, textvariable=self.signal_quality_text, font=("Arial", 12),
                                                  fg="white", bg="#1e1e2e")
-        self.signal_quality_label.place(x=100, y=205, anchor="center")
+        self.signal_quality_label.place(relx=0.5, rely=0.5, anchor="center")
 
-        self.signal_quality_meter = self.Progressbar(control_panel, orient="horizontal", length=160,
-                                                     mode="determinate", maximum=100)
-        self.signal_quality_meter.place(x=20, y=220)
+        self.signal_quality = tk.IntVar()
+        self.signal_quality_meter = self.Progressbar(signal_meter_cell, orient="horizontal", length=160,
+                                                     mode="determinate", maximum=100,
+                                                     variable=self.signal_quality)
+        self.signal_quality_meter.place(x=0, y=0)
+        # Bound setters used on every signal sample; variable writes skip widget configure
+        self._sq_set = self.signal_quality.set
+        self._sq_label_set = self.signal_quality_text.set
 
         self.audio_level = tk.DoubleVar()
-        self.meter = self.Progressbar(control_panel, orient="horizontal", length=160, mode="determinate",
+        self.meter = self.Progressbar(audio_meter_cell, orient="horizontal", length=160, mode="determinate",
                                       variable=self.audio_level)
-        self.meter.place(x=20, y=260)
+        self.meter.place(x=0, y=0)
 
-        self.key_label = self.tkLabel(control_panel, text="STAND-BY", font=("Arial", 12), fg="gray", bg="#1e1e2e")
-        self.key_label.place(x=100, y=300, anchor="center")
+        self.key_label = self.tkLabel(key_cell, text="STAND-BY", font=("Arial", 12), fg="gray", bg="#1e1e2e")
+        self.key_label.place(relx=0.5, rely=0.5, anchor="center")
 
         # Gauges with adjusted positioning
         gauge_x_start = 200  # Move gauges further right
@@ -370,8 +651,14 @@ def setup_control_panel(self, parent):
         
         self.update_overlay_status()
 
-        # Start indicator update loop
+        # Draw the current indicator state, then redraw only when pins change:
+        # GPIO edge events on real hardware, toggle_sim_pin in simulation.
+        # Configured indicator pins were already armed by setup_gpio_pins.
         self.update_indicators()
+        if not SIMULATED_MODE:
+            for pin in INDICATOR_PINS:
+                if pin not in self._pin_cache:
+                    self.watch_indicator_pin(pin)
 
         logger.debug("Control panel setup complete")
 
@@ -396,19 +683,17 @@ def setup_gui(self):
     logger.debug(f"Looking for logo at: {logo_path}")
 
     try:
-        # Handle LANCZOS for different PIL versions
-        if 'Image' in globals():
-            resampling_method = hasattr(Image, 'Resampling') and Image.Resampling.LANCZOS or Image.LANCZOS
-            if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path).resize((800, 100), resampling_method)
-                self.logo_photo = ImageTk.PhotoImage(logo_img)
-                self.tkLabel(main_frame, image=self.logo_photo, bg="#1e1e2e").pack(pady=(5, 0))
-                logger.info("Logo loaded successfully")
-            else:
-                logger.warning(f"Logo not found at {logo_path}")
-                self.tkLabel(main_frame, text="[LOGO MISSING]", fg="red", bg="#1e1e2e", font=("Arial", 18)).pack()
+        if os.path.exists(logo_path):
+            # The shipped logo is already 800x100, so Tk loads it directly;
+            # only a replacement file of another size goes through PIL
+            logo_photo = tk.PhotoImage(file=logo_path)
+            if (logo_photo.width(), logo_photo.height()) != (800, 100) and Image is not None:
+                logo_photo = ImageTk.PhotoImage(Image.open(logo_path).resize((800, 100), _LANCZOS))
+            self.logo_photo = logo_photo
+            self.tkLabel(main_frame, image=self.logo_photo, bg="#1e1e2e").pack(pady=(5, 0))
+            logger.info("Logo loaded successfully")
         else:
-            logger.warning("PIL not available - logo cannot be displayed")
+            logger.warning(f"Logo not found at {logo_path}")
             self.tkLabel(main_frame, text="[LOGO MISSING]", fg="red", bg="#1e1e2e", font=("Arial", 18)).pack()
     except Exception as e:
         logger.error(f"Logo image error: {e}")
@@ -428,14 +713,24 @@ def setup_gui(self):
 def update_overlay_status(self):
     """Update status overlay visibility based on configuration"""
     try:
-        values = list(config_data.values())
-        has_landing_gear = any(val == "Landing Gear Control" for val in values)
-        has_nav_lights = any(val == "Nav Light Toggle" for val in values)
-        has_analog_module = any(val == "Analog Input Module" for val in values)
-        has_mic = any(val == "Mic Control" for val in values)
+        configured = self._configured_functions
+        has_landing_gear = "Landing Gear Control" in configured
+        has_nav_lights = "Nav Light Toggle" in configured
+        has_analog_module = "Analog Input Module" in configured
+        has_mic = "Mic Control" in configured
+
+        # A reload can change indicator pins without changing the flags, so always redraw them
+        self.update_indicators()
+
+        # The overlays depend only on these four flags; skip reloads that leave them unchanged
+        flags = (has_landing_gear, has_nav_lights, has_analog_module, has_mic)
+        if flags == self._overlay_flags:
+            return
+        self._overlay_flags = flags
 
         logger.debug(
-            f"Status: Landing Gear={has_landing_gear}, Nav Lights={has_nav_lights}, Analog Module={has_analog_module}, Mic={has_mic}"
+            "Status: Landing Gear=%s, Nav Lights=%s, Analog Module=%s, Mic=%s",
+            has_landing_gear, has_nav_lights, has_analog_module, has_mic
         )
 
         # === Handle center overlay (airplane image) ===
@@ -484,8 +779,9 @@ def update_overlay_status(self):
         # === Handle signal status (position over signal quality meter) ===
         if not has_analog_module:
             self.no_signal_label.place(x=600, y=365, anchor="center")  # Over signal quality meter (x=20, y=220, length=160)
-            self.signal_quality_label.config(text="Signal Quality: N/A")
-            self.signal_quality_meter["value"] = 0
+            self._sq_label_set("Signal Quality: N/A")
+            self._sq_set(0)
+            self._last_percent = -1
         else:
             self.no_signal_label.place_forget()
 
@@ -496,71 +792,87 @@ def update_overlay_status(self):
             self.audio_level.set(0)
         else:
             self.no_audio_label.place_forget()
-
-        # Update indicators
-        self.update_indicators()
     except Exception as e:
         logger.error(f"Error updating overlay status: {e}")
         logger.error(traceback.format_exc())
 
 
+def _refresh_indicator_fills(self, pins=None):
+    """Recolor the indicators (all, or only those driven by pins) whose state changed"""
+    # Bind everything the loop touches to locals once per call
+    configured = self._configured_functions
+    get_pin_state = self.get_pin_state
+    last_fill = self._last_fill
+    set_fill = self._set_indicator_fill
+    for function, item, pin, colors in self._indicator_spec:
+        # Only landing gear / nav light indicators whose function is configured are live
+        if function not in configured or (pins is not None and pin not in pins):
+            continue
+        color = colors[bool(get_pin_state(pin))]
+        # Only send a canvas update for indicators whose color changed
+        if last_fill.get(item) != color:
+            set_fill(item, "-fill", color)
+            last_fill[item] = color
+
+
 def update_indicators(self):
     """Update all visual indicators based on current state"""
     try:
-        # Update landing gear indicators
-        if is_function_configured(config_data, "Landing Gear Control"):
-            nose_state = self.get_pin_state(NOSE_GEAR_PIN)
-            left_state = self.get_pin_state(LEFT_GEAR_PIN)
-            right_state = self.get_pin_state(RIGHT_GEAR_PIN)
-
-            # Update nose gear
-            if nose_state:
-                self.canvas.itemconfig(self.indicators["nose"], fill="green")
-            else:
-                self.canvas.itemconfig(self.indicators["nose"], fill="red")
+        _refresh_indicator_fills(self)
+    except Exception as e:
+        logger.error(f"Error updating indicators: {e}")
 
-            # Update left gear
-            if left_state:
-                self.canvas.itemconfig(self.indicators["left"], fill="green")
-            else:
-                self.canvas.itemconfig(self.indicators["left"], fill="red")
 
-            # Update right gear
-            if right_state:
-                self.canvas.itemconfig(self.indicators["right"], fill="green")
-            else:
-                self.canvas.itemconfig(self.indicators["right"], fill="red")
+def mark_indicator_dirty(self, pin):
+    """Queue a redraw for one pin's indicator; changes in the same tick share one flush"""
+    if not self._dirty_pins:
+        self.root.after_idle(self.flush_indicators)
+    self._dirty_pins.add(pin)
 
-        # Update nav light indicators
-        if is_function_configured(config_data, "Nav Light Toggle"):
-            left_nav = self.get_pin_state(LEFT_NAV_PIN)
-            right_nav = self.get_pin_state(RIGHT_NAV_PIN)
-            tail_nav = self.get_pin_state(TAIL_NAV_PIN)
 
-            # Update left nav
-            if left_nav:
-                self.canvas.itemconfig(self.indicators["nav_left"], fill="yellow")
-            else:
-                self.canvas.itemconfig(self.indicators["nav_left"], fill="gray")
+def flush_indicators(self):
+    """Redraw only the indicators whose pins were marked dirty"""
+    dirty = self._dirty_pins
+    self._dirty_pins = set()
+    try:
+        _refresh_indicator_fills(self, dirty)
+    except Exception as e:
+        logger.error(f"Error flushing indicators: {e}")
 
-            # Update right nav
-            if right_nav:
-                self.canvas.itemconfig(self.indicators["nav_right"], fill="yellow")
-            else:
-                self.canvas.itemconfig(self.indicators["nav_right"], fill="gray")
 
-            # Update tail nav
-            if tail_nav:
-                self.canvas.itemconfig(self.indicators["nav_tail"], fill="yellow")
-            else:
-                self.canvas.itemconfig(self.indicators["nav_tail"], fill="gray")
+def watch_indicator_pin(self, pin):
+    """Redraw the indicators whenever an indicator input pin changes (real hardware only)"""
+    if SIMULATED_MODE:
+        return
+    try:
+        GPIO.add_event_detect(pin, GPIO.BOTH, callback=self.on_pin_edge, bouncetime=EDGE_BOUNCE_MS)
+    except RuntimeError as e:
+        # Edge detection is already active for this pin
+        logger.debug("Edge detection not added for pin %s: %s", pin, e)
+    # Seed the cached level; edges keep it current from here on
+    try:
+        self._pin_cache[pin] = GPIO.input(pin)
+    except RuntimeError as e:
+        # The pin is not set up as an input (e.g. its function is not configured)
+        logger.debug("Could not read indicator pin %s: %s", pin, e)
+        self._pin_cache.pop(pin, None)
+
 
-        # Schedule next update
-        self.root.after(200, self.update_indicators)
+def on_pin_edge(self, channel):
+    """GPIO edge callback - runs on the RPi.GPIO thread, so hand off to Tk"""
+    # Read the pin once the debounce window has passed so a bouncing contact
+    # is not sampled mid-transition
+    self.root.after(EDGE_BOUNCE_MS, self.cache_pin_state, channel)
+
+
+def cache_pin_state(self, pin):
+    """Store a watched pin's settled level and queue its indicator redraw"""
+    try:
+        self._pin_cache[pin] = GPIO.input(pin)
     except Exception as e:
-        logger.error(f"Error updating indicators: {e}")
-        # Still try to keep the update loop running
-        self.root.after(1000, self.update_indicators)
+        logger.error(f"Error reading pin {pin} after edge: {e}")
+        self._pin_cache.pop(pin, None)
+    self.mark_indicator_dirty(pin)
 
 
 def get_pin_state(self, pin):
@@ -568,8 +880,9 @@ def get_pin_state(self, pin):
     try:
         if SIMULATED_MODE:
             return self.simulated_inputs[pin]
-        else:
-            return GPIO.input(pin)
+        # Edge-watched pins are served from the cache; anything else is read directly
+        state = self._pin_cache.get(pin)
+        return GPIO.input(pin) if state is None else state
     except Exception as e:
         logger.error(f"Error getting pin state for pin {pin}: {e}")
         return 1  # Default to HIGH
@@ -581,7 +894,8 @@ def toggle_sim_pin(self, pin):
         self.simulated_inputs[pin] = 0 if self.simulated_inputs[pin] else 1
         # Update actual pin state tracking
         PIN_STATES[pin] = self.simulated_inputs[pin]
-        logger.debug(f"Toggled simulation pin {pin} to {self.simulated_inputs[pin]}")
+        logger.debug("Toggled simulation pin %s to %s", pin, self.simulated_inputs[pin])
+        self.mark_indicator_dirty(pin)
     except Exception as e:
         logger.error(f"Error toggling simulated pin {pin}: {e}")
 
@@ -589,11 +903,17 @@ def toggle_sim_pin(self, pin):
 def simulate_signal_quality(self, voltage):
     """Simulate signal quality based on voltage"""
     try:
-        if is_function_configured(config_data, "Analog Input Module"):
-            percent = min(max(int((voltage / 3.3) * 100), 0), 100)
-            logger.debug(f"Signal quality simulated at {percent}%")
-            self.signal_quality_label.config(text=f"Signal Quality: {percent}%")
-            self.signal_quality_meter["value"] = percent
+        if not self._coax_configured:
+            return
+        p = int(voltage * SIGNAL_PCT_PER_VOLT)
+        percent = 0 if p < 0 else 100 if p > 100 else p
+        # Ignore 1% ADC jitter, but always let the end stops through
+        if abs(percent - self._last_percent) <= 1 and 0 < percent < 100:
+            return
+        self._last_percent = percent
+        logger.debug("Signal quality set to %s%%", percent)
+        self._sq_label_set(f"Signal Quality: {percent}%")
+        self._sq_set(percent)
     except Exception as e:
         logger.error(f"Error simulating signal quality: {e}")
 
@@ -601,27 +921,8 @@ def simulate_signal_quality(self, voltage):
 def update_pot_value(self, value):
     """Update potentiometer gauge value - convert to resistance"""
     try:
-        if hasattr(self, 'pot_gauge'):
-            # Convert 0-100% to 0-10k ohms resistance
-            resistance = int((value / 100) * 10000)
-            
-            # Update needle position (180 degrees = full left, 0 degrees = full right)
-            angle = 180 - (value / 100) * 180  # Reverse the angle so 0% = left, 100% = right
-            rad = math.radians(angle)
-            x = self.pot_gauge['center_x'] + (self.pot_gauge['radius'] * math.cos(rad))
-            y = self.pot_gauge['center_y'] - (self.pot_gauge['radius'] * math.sin(rad))
-            self.pot_gauge['canvas'].coords(self.pot_gauge['needle'],
-                                          self.pot_gauge['center_x'], self.pot_gauge['center_y'],
-                                          x, y)
-            
-            # Update percentage label
-            self.pot_gauge['value_label'].config(text=f"{int(value)}%")
-            
-            # Update real-time resistance display
-            if resistance >= 1000:
-                self.pot_gauge['realtime_label'].config(text=f"{resistance/1000:.1f}kΩ")
-            else:
-                self.pot_gauge['realtime_label'].config(text=f"{resistance}Ω")
+        # Needle and labels move in 1% steps (0.1kΩ)
+        _update_gauge(self.pot_gauge, value, int(value), _pot_text)
     except Exception as e:
         logger.error(f"Error updating pot value: {e}")
 
@@ -629,24 +930,8 @@ def update_pot_value(self, value):
 def update_temp_value(self, value):
     """Update temperature gauge value - convert to Celsius"""
     try:
-        if hasattr(self, 'temp_gauge'):
-            # Convert 0-100% to 0°C to 100°C temperature range
-            temperature = (value / 100) * 100  # 0°C to 100°C range
-            
-            # Update needle position (180 degrees = full left, 0 degrees = full right)
-            angle = 180 - (value / 100) * 180  # Reverse the angle so 0% = left, 100% = right
-            rad = math.radians(angle)
-            x = self.temp_gauge['center_x'] + (self.temp_gauge['radius'] * math.cos(rad))
-            y = self.temp_gauge['center_y'] - (self.temp_gauge['radius'] * math.sin(rad))
-            self.temp_gauge['canvas'].coords(self.temp_gauge['needle'],
-                                           self.temp_gauge['center_x'], self.temp_gauge['center_y'],
-                                           x, y)
-            
-            # Update percentage label
-            self.temp_gauge['value_label'].config(text=f"{int(value)}%")
-            
-            # Update real-time temperature display
-            self.temp_gauge['realtime_label'].config(text=f"{temperature:.1f}°C")
+        # The temperature label shows tenths of a degree, so dedupe at that step
+        _update_gauge(self.temp_gauge, value, int(value * 10), _temp_text)
     except Exception as e:
         logger.error(f"Error updating temp value: {e}")
 
@@ -654,135 +939,107 @@ def update_temp_value(self, value):
 def update_aux_value(self, value):
     """Update auxiliary gauge value"""
     try:
-        if hasattr(self, 'extra_gauge'):
-            # Update needle position (180 degrees = full left, 0 degrees = full right)
-            angle = 180 - (value / 100) * 180  # Reverse the angle so 0% = left, 100% = right
-            rad = math.radians(angle)
-            x = self.extra_gauge['center_x'] + (self.extra_gauge['radius'] * math.cos(rad))
-            y = self.extra_gauge['center_y'] - (self.extra_gauge['radius'] * math.sin(rad))
-            self.extra_gauge['canvas'].coords(self.extra_gauge['needle'],
-                                          self.extra_gauge['center_x'], self.extra_gauge['center_y'],
-                                          x, y)
-            
-            # Update percentage label
-            self.extra_gauge['value_label'].config(text=f"{int(value)}%")
-            
-            # Update real-time auxiliary display (just percentage for AUX)
-            if hasattr(self.extra_gauge, 'realtime_label'):
-                self.extra_gauge['realtime_label'].config(text=f"{int(value)}%")
+        # AUX has no real-time reading; its percent label is the whole display
+        _update_gauge(self.extra_gauge, value, int(value))
     except Exception as e:
         logger.error(f"Error updating aux value: {e}")
 
 
+def update_gauges(self, pot, temp, aux):
+    """Update all three gauges in one pass, with the same steps as update_*_value"""
+    try:
+        _update_gauge(self.pot_gauge, pot, int(pot), _pot_text)
+        _update_gauge(self.temp_gauge, temp, int(temp * 10), _temp_text)
+        _update_gauge(self.extra_gauge, aux, int(aux))
+    except Exception as e:
+        logger.error(f"Error updating gauges: {e}")
+
+
+def queue_gauge_values(self, pot, temp, aux):
+    """Store the latest gauge readings (from any thread) and schedule a single redraw"""
+    # One tuple assignment, so the Tk thread never sees a half-updated set of readings
+    self._pending_gauge = (pot, temp, aux)
+    if not self._gauge_flush_pending:
+        self._gauge_flush_pending = True
+        self.root.after_idle(self.flush_gauges)
+
+
+def flush_gauges(self):
+    """Draw the most recently queued readings on all three gauges in one pass"""
+    self._gauge_flush_pending = False
+    self.update_gauges(*self._pending_gauge)
+
+
 def start_analog_monitoring(self):
     """Start monitoring all analog inputs (pot, temp, etc.)"""
-    if hasattr(self, 'analog_monitoring') and self.analog_monitoring:
+    if self.analog_monitoring:
         return  # Already running
 
     self.analog_monitoring = True
-    # Add simulation enable flag for better control
-    self.simulation_enabled = getattr(self, 'simulation_enabled', False)
+
+    if SIMULATED_MODE:
+        # Simulated inputs are plain arithmetic, so drive them from a Tk timer
+        # instead of a thread
+        self._sim_values = [0, 25, 50]  # Starting values
+        self._sim_dirs = [1, 1, 1]  # Direction (increasing/decreasing)
+        self._sim_after = self.root.after(100, self.sim_analog_tick)
+        return
+
+    stop = self._analog_stop = threading.Event()
 
     def analog_monitor_thread():
         try:
-            # For smoothing
-            smoothed_pot = 0
-            smoothed_temp = 0
-            smoothed_aux = 0
+            # For smoothing: integer EMA accumulators on the raw ADC counts, each
+            # holding the smoothed reading << _EMA_SHIFT
+            ema_pot = 0
+            ema_temp = 0
+            ema_aux = 0
+
+            # Thermistor reading -> gauge percent, solved once per thread instead of per sample
+            temp_table = _thermistor_table()
 
             # For ADS1115
-            if not SIMULATED_MODE:
-                try:
-                    import board
-                    import busio
-                    import adafruit_ads1x15.ads1115 as ADS
-                    from adafruit_ads1x15.analog_in import AnalogIn
-
-                    i2c = busio.I2C(board.SCL, board.SDA)
-                    ads = ADS.ADS1115(i2c)
-                    pot_channel = AnalogIn(ads, getattr(ADS, f'P{ADS_POT_CHANNEL}'))      # Potentiometer on P0
-                    temp_channel = AnalogIn(ads, getattr(ADS, f'P{ADS_TEMP_CHANNEL}'))    # Temperature on P1
-                    aux_channel = AnalogIn(ads, getattr(ADS, f'P{ADS_SIGNAL_CHANNEL}'))   # Signal Quality on P2
-
-                    while self.analog_monitoring:
-                        # Read potentiometer (0-3.3V maps to 0-100%)
-                        pot_raw = pot_channel.value
-                        pot_pct = (pot_raw / 65535) * 100
-                        smoothed_pot = (pot_pct * 0.2) + (smoothed_pot * 0.8)
-
-                        # Read temperature from 10K thermistor (voltage divider circuit)
-                        temp_raw = temp_channel.value
-                        temp_voltage = (temp_raw / 65535) * 3.3
-                        
-                        # Calculate resistance of thermistor (assuming voltage divider with 10K fixed resistor)
-                        # V_out = V_cc * R_thermistor / (R_fixed + R_thermistor)
-                        # R_thermistor = R_fixed * V_out / (V_cc - V_out)
-                        if temp_voltage < 3.2:  # Avoid division by very small numbers
-                            r_fixed = 10000  # 10K fixed resistor
-                            r_thermistor = r_fixed * temp_voltage / (3.3 - temp_voltage)
-                            
-                            # Convert resistance to temperature using Steinhart-Hart equation (simplified)
-                            # For typical 10K thermistor: Beta = ~3950K, R0 = 10K at 25°C
-                            import math
-                            try:
-                                temp_k = 1 / (1/298.15 + (1/3950) * math.log(r_thermistor/10000))
-                                temp_celsius = temp_k - 273.15
-                            except (ValueError, ZeroDivisionError):
-                                temp_celsius = 25  # Default to room temperature on error
-                        else:
-                            temp_celsius = 25  # Default if voltage too high
-                        
-                        # Scale to 0-100% for gauge display (0°C = 0%, 100°C = 100%)
-                        temp_pct = min(max((temp_celsius / 100) * 100, 0), 100)
-                        smoothed_temp = (temp_pct * 0.2) + (smoothed_temp * 0.8)
-
-                        # Read auxiliary (keep as percentage)
-                        aux_raw = aux_channel.value
-                        aux_pct = (aux_raw / 65535) * 100
-                        smoothed_aux = (aux_pct * 0.2) + (smoothed_aux * 0.8)
-
-                        # Update UI from main thread
-                        self.root.after(0, lambda: self.update_pot_value(smoothed_pot))
-                        self.root.after(0, lambda: self.update_temp_value(smoothed_temp))
-                        self.root.after(0, lambda: self.update_aux_value(smoothed_aux))
-
-                        # Small delay
-                        time.sleep(0.05)
-                except Exception as e:
-                    logger.error(f"Error in analog monitoring: {e}")
-            else:
-                # Simulation mode - keep needles at zero unless simulation is enabled
-                if not self.simulation_enabled:
-                    # Stay at zero when no input
-                    idle_values = [0, 0, 0]
-                    while self.analog_monitoring:
-                        # Update gauges with idle values (zero)
-                        self.root.after(0, lambda: self.update_pot_value(idle_values[0]))
-                        self.root.after(0, lambda: self.update_temp_value(idle_values[1]))
-                        self.root.after(0, lambda: self.update_aux_value(idle_values[2]))
-                        time.sleep(0.1)
-                else:
-                    # Original simulation with moving values
-                    sim_values = [0, 25, 50]  # Starting values
-                    sim_dirs = [1, 1, 1]  # Direction (increasing/decreasing)
-
-                    while self.analog_monitoring:
-                        # Update simulation values
-                        for i in range(3):
-                            sim_values[i] += sim_dirs[i] * (i + 1)  # Different speeds
-                            if sim_values[i] >= 100:
-                                sim_values[i] = 100
-                                sim_dirs[i] = -1
-                            elif sim_values[i] <= 0:
-                                sim_values[i] = 0
-                                sim_dirs[i] = 1
-
-                        # Update gauges with simulated values
-                        self.root.after(0, lambda: self.update_pot_value(sim_values[0]))
-                        self.root.after(0, lambda: self.update_temp_value(sim_values[1]))
-                        self.root.after(0, lambda: self.update_aux_value(sim_values[2]))
-
-                        time.sleep(0.1)
+            try:
+                if ADS_LIBRARY != "circuitpython":
+                    raise ImportError("adafruit-circuitpython-ads1x15 is required for the gauges")
+
+                i2c = busio.I2C(board.SCL, board.SDA)
+                # Each single-shot read waits out one conversion: ~8 ms at the default
+                # 128 SPS, ~1.2 ms at the fastest rate. The EMA absorbs the extra noise.
+                ads = ADS.ADS1115(i2c, data_rate=_ADS_DATA_RATE)
+                pot_channel = AnalogIn(ads, getattr(ADS, f'P{ADS_POT_CHANNEL}'))      # Potentiometer on P0
+                temp_channel = AnalogIn(ads, getattr(ADS, f'P{ADS_TEMP_CHANNEL}'))    # Temperature on P1
+                aux_channel = AnalogIn(ads, getattr(ADS, f'P{ADS_SIGNAL_CHANNEL}'))   # Signal Quality on P2
+
+                while not stop.is_set():
+                    # Each step adds (new sample - smoothed value) to the accumulator,
+                    # i.e. smoothed += (sample - smoothed) / 2**_EMA_SHIFT in integers
+                    pot_delta = pot_channel.value - (ema_pot >> _EMA_SHIFT)
+                    ema_pot += pot_delta
+                    temp_delta = temp_channel.value - (ema_temp >> _EMA_SHIFT)
+                    ema_temp += temp_delta
+                    aux_delta = aux_channel.value - (ema_aux >> _EMA_SHIFT)
+                    ema_aux += aux_delta
+
+                    # Read potentiometer (0-3.3V maps to 0-100%)
+                    pot_pct = (ema_pot >> _EMA_SHIFT) * _ADC_TO_PCT
+
+                    # Temperature from the 10K thermistor, looked up from the smoothed reading
+                    temp_raw = (ema_temp >> _EMA_SHIFT) >> _THERMISTOR_SHIFT
+                    temp_pct = temp_table[temp_raw if temp_raw > 0 else 0]
+
+                    # Read auxiliary (keep as percentage)
+                    aux_pct = (ema_aux >> _EMA_SHIFT) * _ADC_TO_PCT
+
+                    # Update UI from main thread
+                    self.queue_gauge_values(pot_pct, temp_pct, aux_pct)
+
+                    # Sample at 20 Hz while a knob or sensor is moving (or the needles are
+                    # still settling); back off to 5 Hz once every input is steady
+                    moving = max(abs(pot_delta), abs(temp_delta), abs(aux_delta)) > _ANALOG_STEADY_RAW
+                    stop.wait(_ANALOG_ACTIVE_S if moving else _ANALOG_IDLE_S)
+            except Exception as e:
+                logger.error(f"Error in analog monitoring: {e}")
 
         except Exception as e:
             logger.error(f"Error in analog monitoring thread: {e}")
@@ -793,15 +1050,50 @@ def start_analog_monitoring(self):
     self.analog_thread.start()
 
 
+def sim_analog_tick(self):
+    """Advance the simulated analog inputs one step (simulated mode, every 100ms)"""
+    try:
+        self._sim_after = None
+        if not self.analog_monitoring:
+            return
+        if not self.simulation_enabled:
+            # Keep needles at zero and stop ticking; toggle_simulation_mode restarts the timer
+            self.update_gauges(0, 0, 0)
+            return
+
+        # Moving values, each channel at a different speed
+        sim_values = self._sim_values
+        sim_dirs = self._sim_dirs
+        for i in range(3):
+            sim_values[i] += sim_dirs[i] * (i + 1)
+            if sim_values[i] >= 100:
+                sim_values[i] = 100
+                sim_dirs[i] = -1
+            elif sim_values[i] <= 0:
+                sim_values[i] = 0
+                sim_dirs[i] = 1
+
+        # Already on the Tk thread, so draw directly
+        self.update_gauges(*sim_values)
+        self._sim_after = self.root.after(100, self.sim_analog_tick)
+    except Exception as e:
+        logger.error(f"Error in analog simulation tick: {e}")
+
+
 def stop_analog_monitoring(self):
     """Stop analog monitoring"""
     self.analog_monitoring = False
+    if self._analog_stop is not None:
+        self._analog_stop.set()
+    if self._sim_after is not None:
+        self.root.after_cancel(self._sim_after)
+        self._sim_after = None
 
 
 def toggle_simulation_mode(self):
     """Toggle simulation mode for analog needles"""
     try:
-        self.simulation_enabled = not getattr(self, 'simulation_enabled', False)
+        self.simulation_enabled = not self.simulation_enabled
         status = "enabled" if self.simulation_enabled else "disabled"
         logger.info(f"Simulation mode {status}")
         
@@ -814,12 +1106,10 @@ def toggle_simulation_mode(self):
         
         # If simulation is disabled, immediately set all needles to zero
         if not self.simulation_enabled:
-            if hasattr(self, 'pot_gauge') and self.pot_gauge:
-                self.update_pot_value(0)
-            if hasattr(self, 'temp_gauge') and self.temp_gauge:
-                self.update_temp_value(0)
-            if hasattr(self, 'extra_gauge') and self.extra_gauge:
-                self.update_aux_value(0)
+            self.update_gauges(0, 0, 0)
+        elif SIMULATED_MODE and self.analog_monitoring and self._sim_after is None:
+            # The simulated inputs stop ticking while disabled; start them again
+            self._sim_after = self.root.after(100, self.sim_analog_tick)
         
         return self.simulation_enabled
     except Exception as e:
@@ -831,71 +1121,28 @@ def gauge_startup_animation(self):
     """Fancy startup animation for all gauges - sweeps needles like car dashboard"""
     try:
         logger.info("Starting gauge startup animation")
+
+        # The sweep draws the gauges directly, so force the next update_*_value calls to redraw
+        for gauge in (self.pot_gauge, self.temp_gauge, self.extra_gauge):
+            if gauge:
+                gauge.last = None
         
         # Animation parameters
-        animation_steps = 50  # Number of steps in animation
         sweep_delay = 30      # Milliseconds between steps
         settle_delay = 1000   # Wait time before settling back to idle
+        gauges = (self.pot_gauge, self.temp_gauge, self.extra_gauge)
         
         def animate_step(step):
             try:
-                # Calculate sweep position (0 to 100 and back to 0)
-                if step <= animation_steps // 2:
-                    # Sweep from 0% to 100%
-                    progress = (step / (animation_steps // 2)) * 100
-                else:
-                    # Sweep from 100% back to 0%
-                    progress = ((animation_steps - step) / (animation_steps // 2)) * 100
-                
-                # Update all three gauges
-                if hasattr(self, 'pot_gauge') and self.pot_gauge:
-                    # POT gauge - animate needle
-                    angle = 180 - (progress / 100) * 180
-                    rad = math.radians(angle)
-                    x = self.pot_gauge['center_x'] + (self.pot_gauge['radius'] * math.cos(rad))
-                    y = self.pot_gauge['center_y'] - (self.pot_gauge['radius'] * math.sin(rad))
-                    self.pot_gauge['canvas'].coords(self.pot_gauge['needle'],
-                                                  self.pot_gauge['center_x'], self.pot_gauge['center_y'],
-                                                  x, y)
-                    # Update labels during animation
-                    resistance = int((progress / 100) * 10000)
-                    self.pot_gauge['value_label'].config(text=f"{int(progress)}%")
-                    if resistance >= 1000:
-                        self.pot_gauge['realtime_label'].config(text=f"{resistance/1000:.1f}kΩ")
-                    else:
-                        self.pot_gauge['realtime_label'].config(text=f"{resistance}Ω")
-                
-                if hasattr(self, 'temp_gauge') and self.temp_gauge:
-                    # TEMP gauge - animate needle
-                    angle = 180 - (progress / 100) * 180
-                    rad = math.radians(angle)
-                    x = self.temp_gauge['center_x'] + (self.temp_gauge['radius'] * math.cos(rad))
-                    y = self.temp_gauge['center_y'] - (self.temp_gauge['radius'] * math.sin(rad))
-                    self.temp_gauge['canvas'].coords(self.temp_gauge['needle'],
-                                                   self.temp_gauge['center_x'], self.temp_gauge['center_y'],
-                                                   x, y)
-                    # Update labels during animation
-                    temperature = ((progress / 100) * 100) - 20
-                    self.temp_gauge['value_label'].config(text=f"{int(progress)}%")
-                    self.temp_gauge['realtime_label'].config(text=f"{temperature:.1f}°C")
-                
-                if hasattr(self, 'extra_gauge') and self.extra_gauge:
-                    # AUX gauge - animate needle
-                    angle = 180 - (progress / 100) * 180
-                    rad = math.radians(angle)
-                    x = self.extra_gauge['center_x'] + (self.extra_gauge['radius'] * math.cos(rad))
-                    y = self.extra_gauge['center_y'] - (self.extra_gauge['radius'] * math.sin(rad))
-                    self.extra_gauge['canvas'].coords(self.extra_gauge['needle'],
-                                                    self.extra_gauge['center_x'], self.extra_gauge['center_y'],
-                                                    x, y)
-                    # Update labels during animation
-                    self.extra_gauge['value_label'].config(text=f"{int(progress)}%")
-                    if hasattr(self.extra_gauge, 'realtime_label'):
-                        self.extra_gauge['realtime_label'].config(text=f"{int(progress)}%")
+                # Every frame's position and readouts are precomputed in _SWEEP_FRAMES
+                frames = _SWEEP_FRAMES[step]
+                for gauge, frame in zip(gauges, frames):
+                    if gauge:
+                        _draw_gauge(gauge, *frame)
                 
                 # Continue animation or finish
-                if step < animation_steps:
-                    self.root.after(sweep_delay, lambda: animate_step(step + 1))
+                if step < len(_SWEEP_FRAMES) - 1:
+                    self.root.after(sweep_delay, animate_step, step + 1)
                 else:
                     # Animation complete, settle to idle position after delay
                     self.root.after(settle_delay, self.settle_gauges_to_idle)
@@ -916,14 +1163,7 @@ def settle_gauges_to_idle(self):
         logger.info("Settling gauges to idle position")
         
         # Set all gauges to 0% (idle position)
-        if hasattr(self, 'pot_gauge') and self.pot_gauge:
-            self.update_pot_value(0)
-        
-        if hasattr(self, 'temp_gauge') and self.temp_gauge:
-            self.update_temp_value(0)
-            
-        if hasattr(self, 'extra_gauge') and self.extra_gauge:
-            self.update_aux_value(0)
+        self.update_gauges(0, 0, 0)
             
         logger.info("Gauge startup animation complete")
         
@@ -22,11 +22,11 @@ if sys.platform == "win32":
 
     def mock_output(pin, state):
         GPIO.state[pin] = state
-        logger.debug(f"MOCK: Set pin {pin} to {state}")
+        logger.debug("MOCK: Set pin %s to %s", pin, state)
 
     def mock_input(pin):
         state = GPIO.state.get(pin, 1)
-        logger.debug(f"MOCK: Read pin {pin} as {state}")
+        logger.debug("MOCK: Read pin %s as %s", pin, state)
         return state
 
     GPIO.output = mock_output
@@ -54,17 +54,40 @@ else:
 
         def mock_output(pin, state):
             GPIO.state[pin] = state
-            logger.debug(f"MOCK: Set pin {pin} to {state}")
+            logger.debug("MOCK: Set pin %s to %s", pin, state)
 
         def mock_input(pin):
             state = GPIO.state.get(pin, 1)
-            logger.debug(f"MOCK: Read pin {pin} as {state}")
+            logger.debug("MOCK: Read pin %s as %s", pin, state)
             return state
 
         GPIO.output = mock_output
         GPIO.input = mock_input
         SIMULATED_MODE = True
 
+# ADS1115 driver, imported once for every reader thread: the CircuitPython
+# library first, the legacy Adafruit_ADS1x15 library as a fallback
+board = busio = ADS = AnalogIn = Adafruit_ADS1x15 = None
+ADS_LIBRARY = None  # "circuitpython", "adafruit" or None when neither is installed
+if not SIMULATED_MODE:
+    try:
+        import board
+        import busio
+        import adafruit_ads1x15.ads1115 as ADS
+        from adafruit_ads1x15.analog_in import AnalogIn
+        ADS_LIBRARY = "circuitpython"
+    except Exception as e:
+        # Blinka raises NotImplementedError/RuntimeError on boards it does not
+        # recognise; that must not stop the app, only disable the ADC
+        logger.info(f"CircuitPython ADS1115 library unavailable: {e}")
+        board = busio = ADS = AnalogIn = None
+        try:
+            import Adafruit_ADS1x15
+            ADS_LIBRARY = "adafruit"
+        except Exception as e:
+            logger.warning(f"No ADS1115 library available - analog inputs disabled: {e}")
+            Adafruit_ADS1x15 = None
+
 PIN_STATES = {}
 
 def initialize_gpio():
@@ -378,16 +378,17 @@ class GPIOConfiguratorApp:
     def delete_gpio(self, pin):
         """Delete a GPIO configuration"""
         try:
-            pin_str = str(pin)
-            if pin_str in config_data:
+            # load_config keys numeric pins as ints (the analog module stays "2,3")
+            key = int(pin) if str(pin).isdigit() else pin
+            if key in config_data:
                 logger.info(f"Deleting GPIO configuration for pin {pin}")
 
                 # Special handling for mic control
-                if config_data[pin_str] == "Mic Control":
+                if config_data[key] == "Mic Control":
                     logger.info("Stopping mic control monitoring")
                     self.stop_mic_check()
 
-                del config_data[pin_str]
+                del config_data[key]
                 save_config(config_data)
                 self.load_gpio_controls()
                 self.update_overlay_status()
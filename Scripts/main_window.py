@@ -3,8 +3,9 @@ import os
 import tkinter as tk
 import logging
 from gpio_handler import initialize_gpio, cleanup_gpio, SIMULATED_MODE, GPIO, PIN_STATES
+from gpio_handler import ADS_LIBRARY, board, busio, ADS, AnalogIn, Adafruit_ADS1x15
 from config_manager import load_config, save_config, config_data, clear_config_on_startup
-from utils import is_function_configured, is_mic_and_analog_configured, toggle_gpio_state
+from utils import toggle_gpio_state
 from constants import *
 import math
 import time
@@ -14,19 +15,21 @@ from tkinter import messagebox
 from config_window import open_config_window
 from control_panel import (
     setup_control_panel, setup_gui, setup_gpio_area,
-    load_gpio_controls, create_gpio_control,
+    load_gpio_controls, create_gpio_control, setup_gpio_pins, refresh_configured_functions,
     draw_square, draw_circle, create_gauge,
     update_overlay_status, update_indicators,
+    mark_indicator_dirty, flush_indicators,
+    watch_indicator_pin, on_pin_edge, cache_pin_state,
     get_pin_state, toggle_sim_pin, simulate_signal_quality,
-    update_pot_value, update_temp_value, update_aux_value,
-    start_analog_monitoring, stop_analog_monitoring,
+    update_pot_value, update_temp_value, update_aux_value, update_gauges,
+    queue_gauge_values, flush_gauges,
+    start_analog_monitoring, stop_analog_monitoring, sim_analog_tick,
     gauge_startup_animation, settle_gauges_to_idle,
     create_gauge_overlays, toggle_simulation_mode
 )
 from overlays import create_status_overlays, animate_no_config
 import signal
-import os
-import traceback
+import platform
 
 # Set up logging first before any imports that might use it
 logger = logging.getLogger("GPIO_Control")
@@ -47,6 +50,12 @@ except ImportError:
     from tkinter import ttk
     BOOTSTRAP_AVAILABLE = False
 
+# Analog reading scale factors, folded into single multiplications: legacy
+# Adafruit_ADS1x15 counts to volts (±4.096V range), and volts to mic level
+# percent (3.3V full scale). Signal quality uses SIGNAL_PCT_PER_VOLT.
+_LEGACY_ADC_TO_VOLTS = 4.096 / 32767
+_MIC_PCT_PER_VOLT = 100.0 / 3.3
+
 # Kiosk Mode Configuration - DISABLED to avoid fullscreen issues
 KIOSK_MODE_ENABLED = False       # Set to False to allow normal window operations
 
@@ -87,13 +96,36 @@ class GPIOConfiguratorApp:
         self.no_signal_label = None
         self.no_audio_label = None
         self.indicators = {}
+        self._indicator_spec = ()  # Filled in by setup_control_panel
+        self._last_fill = {}  # Last fill color drawn per indicator canvas item
+        self._dirty_pins = set()  # Pins whose indicators await the next flush
+        self._pin_cache = {}  # Last settled level of edge-watched input pins (hardware only)
+        self._pin_widgets = {}  # config_data key -> (control row, function) shown in the GPIO list
+        self._gpio_row_pool = []  # hidden control rows ready for reuse
+        self._load_errors = []  # (pin, message) control creation failures from the last reload
+        self._pending_pin_setup = []  # (pin, function) pairs whose GPIO setup is queued
+        self._configured_functions = frozenset()  # Refreshed by load_gpio_controls
+        self._coax_configured = False  # Refreshed by load_gpio_controls
+        self._mic_and_analog_configured = False  # Refreshed by load_gpio_controls
+        self._overlay_flags = None  # Configuration flags the status overlays last reflected
+        self._last_percent = -1  # Last signal quality percent shown
+        self._pending_gauge = (0, 0, 0)  # Latest (pot, temp, aux) readings awaiting a redraw
+        self._gauge_flush_pending = False
+        self._sim_after = None  # Pending simulated-analog timer id
         self.audio_stream = None
         self.audio_thread = None
         self.audio_running = False
         self.analog_monitoring = False
+        self.simulation_enabled = False  # Simulated analog needles move only when enabled
+        self.pot_gauge = self.temp_gauge = self.extra_gauge = None  # Created by setup_control_panel
         self.analog_thread = None
         self.pin_monitoring = False
         self.pin_monitor_thread = None
+        # Set to stop (and immediately wake) the current monitor thread; a fresh Event per start
+        # so a stop-then-start can never leave the old thread running
+        self._audio_stop = None
+        self._analog_stop = None
+        self._pin_monitor_stop = None
         self.mic_check_running = False
         
         # Initialize audio level variable
@@ -130,20 +162,31 @@ class GPIOConfiguratorApp:
         self.setup_gui = setup_gui.__get__(self)
         self.setup_gpio_area = setup_gpio_area.__get__(self)
         self.load_gpio_controls = load_gpio_controls.__get__(self)
+        self.refresh_configured_functions = refresh_configured_functions.__get__(self)
         self.create_gpio_control = create_gpio_control.__get__(self)
+        self.setup_gpio_pins = setup_gpio_pins.__get__(self)
         self.draw_square = draw_square.__get__(self)
         self.draw_circle = draw_circle.__get__(self)
         self.create_gauge = create_gauge.__get__(self)
         self.update_overlay_status = update_overlay_status.__get__(self)
         self.update_indicators = update_indicators.__get__(self)
+        self.mark_indicator_dirty = mark_indicator_dirty.__get__(self)
+        self.flush_indicators = flush_indicators.__get__(self)
+        self.watch_indicator_pin = watch_indicator_pin.__get__(self)
+        self.on_pin_edge = on_pin_edge.__get__(self)
+        self.cache_pin_state = cache_pin_state.__get__(self)
         self.get_pin_state = get_pin_state.__get__(self)
         self.toggle_sim_pin = toggle_sim_pin.__get__(self)
         self.simulate_signal_quality = simulate_signal_quality.__get__(self)
         self.update_pot_value = update_pot_value.__get__(self)
         self.update_temp_value = update_temp_value.__get__(self)
         self.update_aux_value = update_aux_value.__get__(self)
+        self.update_gauges = update_gauges.__get__(self)
+        self.queue_gauge_values = queue_gauge_values.__get__(self)
+        self.flush_gauges = flush_gauges.__get__(self)
         self.start_analog_monitoring = start_analog_monitoring.__get__(self)
         self.stop_analog_monitoring = stop_analog_monitoring.__get__(self)
+        self.sim_analog_tick = sim_analog_tick.__get__(self)
         self.gauge_startup_animation = gauge_startup_animation.__get__(self)
         self.settle_gauges_to_idle = settle_gauges_to_idle.__get__(self)
         self.create_gauge_overlays = create_gauge_overlays.__get__(self)
@@ -162,6 +205,9 @@ class GPIOConfiguratorApp:
         # Start pin monitoring for hardware mode
         if not SIMULATED_MODE:
             self.start_pin_monitoring()
+            # A Mic Control kept with --keep-config needs its check started here;
+            # later assignments start it from save_assignment
+            self.start_mic_check()
         
         # Initialize auto-updater (safe, runs in background)
         if AUTO_UPDATER_AVAILABLE:
@@ -179,10 +225,11 @@ class GPIOConfiguratorApp:
             if messagebox.askyesno("Confirm", "Are you sure you want to clear all GPIO configurations?", parent=self.root):
                 logger.info("Manually clearing all GPIO configurations")
 
-                # Close config window if open
+                # Hide config window if open (it is kept around for reuse)
                 try:
                     if hasattr(self, 'config_window') and self.config_window.winfo_exists():
-                        self.config_window.destroy()
+                        self.config_window.grab_release()
+                        self.config_window.withdraw()
                 except (AttributeError, tk.TclError):
                     # Window doesn't exist or was already destroyed
                     pass
@@ -195,14 +242,6 @@ class GPIOConfiguratorApp:
                 if hasattr(self, 'stop_analog_monitoring'):
                     self.stop_analog_monitoring()
 
-                # Clear all controls from GUI first
-                if hasattr(self, 'main_frame'):
-                    logger.info("Clearing all widgets from main_frame")
-                    for widget in self.main_frame.winfo_children():
-                        widget.destroy()
-                    # Force update after destroying widgets
-                    self.main_frame.update_idletasks()
-
                 # Clear PIN_STATES
                 PIN_STATES.clear()
                 logger.info("PIN_STATES cleared")
@@ -214,19 +253,11 @@ class GPIOConfiguratorApp:
                 load_config()
                 logger.info(f"Config reloaded: {config_data}")
                 
-                # Reload the UI (should show no controls since config is empty)
+                # Reload the UI (should show no controls since config is empty).
+                # load_gpio_controls removes the old widgets and resizes the scroll region.
                 self.load_gpio_controls()
                 self.update_overlay_status()
                 
-                # Force comprehensive UI update
-                if hasattr(self, 'main_canvas'):
-                    self.main_canvas.update_idletasks()
-                    self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
-                
-                # Force a complete redraw of the entire root window
-                self.root.update_idletasks()
-                self.root.update()
-                
                 logger.info("All configurations cleared manually - GUI refreshed")
                 
                 # Show confirmation
@@ -244,43 +275,23 @@ class GPIOConfiguratorApp:
                 logger.info(f"Deleting configuration for pin {pin}")
                 
                 # Remove from config
-                if str(pin) in config_data:
+                if pin in config_data:
                     # Clean up GPIO state
                     if pin in PIN_STATES:
                         del PIN_STATES[pin]
                     
                     # If it's the mic control, stop the mic check
-                    if config_data[str(pin)] == "Mic Control" and hasattr(self, 'stop_mic_check'):
+                    if config_data[pin] == "Mic Control" and hasattr(self, 'stop_mic_check'):
                         self.stop_mic_check()
                     
                     # Delete the configuration
-                    del config_data[str(pin)]
+                    del config_data[pin]
                     save_config(config_data)
                     
-                    # Find and destroy only the frame for this pin
-                    for widget in self.main_frame.winfo_children():
-                        if isinstance(widget, tk.Frame):
-                            # Check if this frame contains the pin we want to delete
-                            for child in widget.winfo_children():
-                                if isinstance(child, tk.Frame):  # This is the inner frame
-                                    for button in child.winfo_children():
-                                        if isinstance(button, tk.Button):
-                                            if f"({pin})" in button.cget("text"):
-                                                # Found the frame with our pin, destroy it
-                                                widget.destroy()
-                                                break
-                    
-                    # Reload controls to ensure proper layout
+                    # Reload controls; only this pin's frame is removed
                     self.load_gpio_controls()
                     self.update_overlay_status()
-                    
-                    # Update the canvas scroll region
-                    if hasattr(self, 'main_canvas'):
-                        self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
-                    
-                    # Force a complete redraw
-                    self.root.update_idletasks()
-                    
+
                     logger.info(f"Configuration for pin {pin} deleted")
         except Exception as e:
             logger.error(f"Error deleting GPIO configuration: {e}")
@@ -333,7 +344,7 @@ class GPIOConfiguratorApp:
             logger.info("Fullscreen toggle disabled - staying in fixed 800x480 window mode")
             
             # Show a brief message that fullscreen is disabled
-            if not hasattr(self, 'config_window') or not self.config_window.winfo_exists():
+            if not hasattr(self, 'config_window') or not self.config_window.winfo_ismapped():
                 self.show_mode_status("FIXED_SIZE")
             
             return "break"  # Prevent event propagation
@@ -387,7 +398,6 @@ class GPIOConfiguratorApp:
     def setup_signal_handlers(self):
         """Setup signal handlers for external control (Unix/Linux only)"""
         try:
-            import platform
             system = platform.system()
             
             # Only set up signal handlers on Unix/Linux systems
@@ -425,7 +435,7 @@ class GPIOConfiguratorApp:
     def key_down(self, event):
         """Handle key down event for mic control"""
         try:
-            if not self.keyed_up and is_mic_and_analog_configured(config_data):
+            if not self.keyed_up and self._mic_and_analog_configured:
                 logger.debug("Key down event received - activating mic")
                 self.keyed_up = True
                 self.key_label.config(text="KEY UP", fg="lime")
@@ -436,7 +446,7 @@ class GPIOConfiguratorApp:
     def key_up(self, event):
         """Handle key up event for mic control"""
         try:
-            if self.keyed_up and is_mic_and_analog_configured(config_data):
+            if self.keyed_up and self._mic_and_analog_configured:
                 logger.debug("Key up event received - deactivating mic")
                 self.keyed_up = False
                 self.key_label.config(text="STAND-BY", fg="gray")
@@ -449,47 +459,52 @@ class GPIOConfiguratorApp:
         try:
             if self.audio_running:
                 return
+
+            stop = threading.Event()
+
+            def show_level(level):
+                # Drop readings queued before stop_audio_monitor zeroed the meter
+                if not stop.is_set():
+                    self.audio_level.set(level)
                 
             if not SIMULATED_MODE:
-                try:
+                if ADS_LIBRARY == "circuitpython":
                     # Try CircuitPython libraries first
-                    import board
-                    import busio
-                    import adafruit_ads1x15.ads1115 as ADS
-                    from adafruit_ads1x15.analog_in import AnalogIn
-
                     i2c = busio.I2C(board.SCL, board.SDA)
                     ads = ADS.ADS1115(i2c)
                     mic_channel = AnalogIn(ads, getattr(ADS, f'P{ADS_MIC_CHANNEL}'))  # Mic on P0
                     use_circuitpython = True
-                except ImportError:
+                elif ADS_LIBRARY == "adafruit":
                     # Fallback to alternative ADS1115 library
-                    try:
-                        import Adafruit_ADS1x15
-                        ads = Adafruit_ADS1x15.ADS1115()
-                        use_circuitpython = False
-                        logger.info("Using Adafruit_ADS1x15 library for ADS1115")
-                    except ImportError:
-                        logger.error("No ADS1115 library available. Install either adafruit-circuitpython-ads1x15 or Adafruit_ADS1x15")
-                        raise Exception("ADS1115 library not available")
+                    ads = Adafruit_ADS1x15.ADS1115()
+                    use_circuitpython = False
+                    logger.info("Using Adafruit_ADS1x15 library for ADS1115")
+                else:
+                    logger.error("No ADS1115 library available. Install either adafruit-circuitpython-ads1x15 or Adafruit_ADS1x15")
+                    raise Exception("ADS1115 library not available")
 
                 self.audio_running = True
+                self._audio_stop = stop
 
                 def adc_mic_monitor():
+                    last_level = None
                     try:
-                        while self.audio_running:
+                        while not stop.is_set():
                             if use_circuitpython:
                                 # CircuitPython library
                                 voltage = mic_channel.voltage
                             else:
                                 # Adafruit_ADS1x15 library
                                 raw_value = ads.read_adc(ADS_MIC_CHANNEL, gain=1)
-                                voltage = raw_value * 4.096 / 32767  # Convert to voltage (assuming ±4.096V range)
+                                voltage = raw_value * _LEGACY_ADC_TO_VOLTS  # Convert to voltage (assuming ±4.096V range)
                             
                             # Map to 0–100 scale (based on typical MAX4466 range)
-                            level = min(max(int((voltage / 3.3) * 100), 0), 100)
-                            self.root.after(0, lambda: self.audio_level.set(level))
-                            time.sleep(0.05)  # 20Hz sampling
+                            level = min(max(int(voltage * _MIC_PCT_PER_VOLT), 0), 100)
+                            # Only wake the Tk thread when the meter would move
+                            if level != last_level:
+                                last_level = level
+                                self.root.after(0, show_level, level)
+                            stop.wait(0.05)  # 20Hz sampling
                     except Exception as e:
                         logger.error(f"Error in ADC mic monitor: {e}")
                         self.root.after(0, lambda: self.key_label.config(text="AUDIO ERROR", fg="red"))
@@ -501,10 +516,11 @@ class GPIOConfiguratorApp:
             else:
                 # Simulated environment
                 self.audio_running = True
+                self._audio_stop = stop
                 def fake_audio():
                     level = 0
                     direction = 1
-                    while self.audio_running:
+                    while not stop.is_set():
                         level += direction * 5
                         if level >= 100:
                             level = 100
@@ -512,8 +528,8 @@ class GPIOConfiguratorApp:
                         elif level <= 0:
                             level = 0
                             direction = 1
-                        self.root.after(0, lambda: self.audio_level.set(level))
-                        time.sleep(0.1)
+                        self.root.after(0, show_level, level)
+                        stop.wait(0.1)
 
                 self.audio_thread = threading.Thread(target=fake_audio, daemon=True)
                 self.audio_thread.start()
@@ -530,6 +546,7 @@ class GPIOConfiguratorApp:
 
             logger.info("Stopping audio monitoring...")
             self.audio_running = False
+            self._audio_stop.set()
             self.audio_level.set(0)
             logger.info("Audio monitoring stopped")
         except Exception as e:
@@ -539,51 +556,65 @@ class GPIOConfiguratorApp:
         """Start monitoring hardware pins for state changes"""
         try:
             self.pin_monitoring = True
+            stop = self._pin_monitor_stop = threading.Event()
             
+            use_circuitpython = ADS_LIBRARY == "circuitpython"
+
+            def _open_coax_channel():
+                """Return the coax reader: a CircuitPython AnalogIn, or the legacy ADS1115 object"""
+                if use_circuitpython:
+                    # Try CircuitPython libraries first
+                    i2c = busio.I2C(board.SCL, board.SDA)
+                    ads = ADS.ADS1115(i2c)
+                    return AnalogIn(ads, getattr(ADS, f'P{ADS_SIGNAL_CHANNEL}'))  # Signal Quality on P1
+                if ADS_LIBRARY == "adafruit":
+                    # Fallback to alternative ADS1115 library
+                    return Adafruit_ADS1x15.ADS1115()
+                raise Exception("ADS1115 library not available")
+
             def pin_monitor_thread():
+                # Last signal quality percent handed to the Tk thread
+                last_signal_percent = None
+                coax_channel = None
                 try:
-                    while self.pin_monitoring:
+                    while not stop.is_set():
                         # Check mic pin state (only if both mic control and analog module are configured)
-                        if is_mic_and_analog_configured(config_data):
+                        if self._mic_and_analog_configured:
                             pin_state = GPIO.input(MIC_CONTROL_PIN)
+                            # One Tk callback per transition; key_down/key_up update the
+                            # label and audio monitor and ignore a repeat posted before they ran
                             if pin_state == 0 and not self.keyed_up:  # Grounded, activate
-                                self.keyed_up = True
-                                self.root.after(0, lambda: self.key_label.config(text="KEY UP", fg="lime"))
-                                self.root.after(0, self.start_audio_monitor)
+                                self.root.after(0, self.key_down, None)
                             elif pin_state == 1 and self.keyed_up:  # Released, deactivate
-                                self.keyed_up = False
-                                self.root.after(0, lambda: self.key_label.config(text="STAND-BY", fg="gray"))
-                                self.root.after(0, self.stop_audio_monitor)
+                                self.root.after(0, self.key_up, None)
 
                         # Check coax signal if configured
-                        if is_function_configured(config_data, "Analog Input Module"):
+                        if self._coax_configured:
                             # Read coax signal via ADS1115
                             try:
-                                try:
-                                    # Try CircuitPython libraries first
-                                    import board
-                                    import busio
-                                    import adafruit_ads1x15.ads1115 as ADS
-                                    from adafruit_ads1x15.analog_in import AnalogIn
-
-                                    i2c = busio.I2C(board.SCL, board.SDA)
-                                    ads = ADS.ADS1115(i2c)
-                                    coax_channel = AnalogIn(ads, getattr(ADS, f'P{ADS_SIGNAL_CHANNEL}'))  # Signal Quality on P1
+                                # Open the ADC on first use and keep it; a read error drops it
+                                # so the next pass reopens the bus
+                                if coax_channel is None:
+                                    coax_channel = _open_coax_channel()
+                                if use_circuitpython:
                                     voltage = coax_channel.voltage
-                                except ImportError:
-                                    # Fallback to alternative ADS1115 library
-                                    import Adafruit_ADS1x15
-                                    ads = Adafruit_ADS1x15.ADS1115()
-                                    raw_value = ads.read_adc(ADS_SIGNAL_CHANNEL, gain=1)
-                                    voltage = raw_value * 4.096 / 32767  # Convert to voltage
-                                
-                                percent = min(max(int((voltage / 3.3) * 100), 0), 100)
-                                self.root.after(0, lambda: self.signal_quality_label.config(text=f"Signal Quality: {percent}%"))
-                                self.root.after(0, lambda: self.signal_quality_meter.configure(value=percent))
+                                else:
+                                    raw_value = coax_channel.read_adc(ADS_SIGNAL_CHANNEL, gain=1)
+                                    voltage = raw_value * _LEGACY_ADC_TO_VOLTS  # Convert to voltage
+
+                                # Only wake the Tk thread when the meter's percent changes
+                                signal_percent = int(voltage * SIGNAL_PCT_PER_VOLT)
+                                if signal_percent != last_signal_percent:
+                                    last_signal_percent = signal_percent
+                                    self.root.after(0, self.simulate_signal_quality, voltage)
                             except Exception as e:
+                                coax_channel = None
                                 logger.error(f"Error reading coax signal: {e}")
+                        else:
+                            # The meter is reset when the module is removed; resend once it returns
+                            last_signal_percent = None
 
-                        time.sleep(0.1)  # Check every 100ms
+                        stop.wait(0.1)  # Check every 100ms
 
                 except Exception as e:
                     logger.error(f"Error in pin monitoring thread: {e}")
@@ -599,6 +630,8 @@ class GPIOConfiguratorApp:
         """Stop hardware pin monitoring"""
         try:
             self.pin_monitoring = False
+            if self._pin_monitor_stop is not None:
+                self._pin_monitor_stop.set()
             logger.info("Pin monitoring stopped")
         except Exception as e:
             logger.error(f"Error stopping pin monitoring: {e}")
@@ -606,7 +639,7 @@ class GPIOConfiguratorApp:
     def start_mic_check(self):
         """Start checking the mic control pin"""
         try:
-            if not SIMULATED_MODE and is_function_configured(config_data, "Mic Control") and not self.mic_check_running:
+            if not SIMULATED_MODE and "Mic Control" in self._configured_functions and not self.mic_check_running:
                 logger.info("Starting mic pin check...")
                 self.mic_check_running = True
             else:
@@ -751,8 +784,6 @@ class GPIOConfiguratorApp:
             logger.info("Close attempt blocked - teacher mode required")
 
 def run_app():
-    import sys
-    
     initialize_gpio()
     
     # Check for command line flag to skip config clearing (for debugging)
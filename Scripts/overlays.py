@@ -1,5 +1,6 @@
 import tkinter as tk
 import logging
+import traceback
 from tkinter import messagebox
 logger = logging.getLogger("GPIO_Control")
 
@@ -36,9 +36,8 @@ def is_function_configured(config_data, function_name):
 
 def is_mic_and_analog_configured(config_data):
     """Check if both Mic Control and Analog Input Module are configured"""
-    has_mic = is_function_configured(config_data, "Mic Control")
-    has_analog = is_function_configured(config_data, "Analog Input Module")
-    return has_mic and has_analog
+    functions = set(config_data.values())
+    return "Mic Control" in functions and "Analog Input Module" in functions
 
 def toggle_gpio_state(pin, btn, status_label, function, app):
     """
@@ -46,7 +45,7 @@ def toggle_gpio_state(pin, btn, status_label, function, app):
     Using a consistent state tracking mechanism for both simulation and real hardware
     """
     pin = int(pin)
-    logger.debug(f"Toggling state for pin {pin} ({function})")
+    logger.debug("Toggling state for pin %s (%s)", pin, function)
     try:
         current_state = PIN_STATES.get(pin, False)
         new_state = not current_state
@@ -55,7 +54,8 @@ def toggle_gpio_state(pin, btn, status_label, function, app):
         signal_state = "Active" if new_state else "Inactive"
         btn.config(text=f"{function} ({pin})")
         status_label.config(text=f"Status: {'ON' if new_state else 'OFF'} | Signal: {signal_state}")
-        logger.debug(f"Pin {pin} set to {new_state}")
+        app.mark_indicator_dirty(pin)
+        logger.debug("Pin %s set to %s", pin, new_state)
     except Exception as e:
         logger.error(f"Error toggling GPIO state: {e}")
         logger.error(traceback.format_exc())